@@ -11,18 +11,17 @@ async def test_yggdrasil():
     print("🌳 Testing Yggdrasil Inside Docker...")
     
     try:
-        manager = YggdrasilScrapingManager()
-        await manager.initialize()
-        print("✅ Yggdrasil manager initialized")
-        
-        # Test academic scraping
-        config = {
-            "wikipedia_categories": ["Philosophy"],
-            "category_limit": 2
-        }
-        
-        results = await manager.scrape_academic_content(config)
-        print(f"✅ Scraped {results.get('scraped_articles', 0)} articles")
+        async with YggdrasilScrapingManager() as manager:
+            print("✅ Yggdrasil manager initialized")
+            
+            # Test academic scraping
+            config = {
+                "wikipedia_categories": ["Philosophy"],
+                "category_limit": 2
+            }
+            
+            results = await manager.scrape_academic_content(config)
+            print(f"✅ Scraped {results.get('scraped_articles', 0)} articles")
         
     except Exception as e:
         print(f"❌ Error: {e}")
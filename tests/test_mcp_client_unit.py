@@ -0,0 +1,316 @@
+"""Unit tests for the Yggdrasil MCP client helpers."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from yggdrasil_mcp.client import yggdrasil_mcp_client as mcp_client
+from yggdrasil_mcp.client.yggdrasil_mcp_client import (
+    CONCURRENCY_ENV_VAR,
+    ProcessingResult,
+    YggdrasilMCPClient,
+    YggdrasilMCPClientPool,
+)
+
+
+class TestConcurrency:
+    """Unit tests for resolving batch concurrency."""
+
+    @pytest.mark.unit
+    def test_explicit_value_wins(self, monkeypatch):
+        """An explicit max_concurrent overrides the environment."""
+        monkeypatch.setenv(CONCURRENCY_ENV_VAR, "64")
+        assert mcp_client._concurrency(8, 32) == 8
+
+    @pytest.mark.unit
+    def test_environment_then_fallback(self, monkeypatch):
+        """Without one, the environment is used, then the fallback."""
+        monkeypatch.delenv(CONCURRENCY_ENV_VAR, raising=False)
+        assert mcp_client._concurrency(None, 32) == 32
+
+        monkeypatch.setenv(CONCURRENCY_ENV_VAR, "64")
+        assert mcp_client._concurrency(None, 32) == 64
+
+    @pytest.mark.unit
+    def test_invalid_environment_value_is_ignored(self, monkeypatch):
+        """A non-integer environment value falls back instead of raising."""
+        monkeypatch.setenv(CONCURRENCY_ENV_VAR, "lots")
+        assert mcp_client._concurrency(None, 32) == 32
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("value", [0, -3])
+    def test_clamped_to_one(self, monkeypatch, value):
+        """Zero or negative values still leave one worker."""
+        assert mcp_client._concurrency(value, 32) == 1
+
+        monkeypatch.setenv(CONCURRENCY_ENV_VAR, str(value))
+        assert mcp_client._concurrency(None, 32) == 1
+
+
+def tool_result(text=None, structured=None):
+    """Minimal stand-in for an MCP CallToolResult."""
+    content = [SimpleNamespace(type="text", text=text)] if text is not None else []
+    return SimpleNamespace(content=content, structuredContent=structured)
+
+
+class TestParseResult:
+    """Unit tests for parsing tool call results."""
+
+    @pytest.mark.unit
+    def test_prefers_structured_content(self):
+        """Structured content is returned without decoding the text."""
+        result = tool_result(text="not json", structured={"ok": True})
+        assert mcp_client._parse_result(result, mcp_client._ANALYZE_MARKER) == {"ok": True}
+
+    @pytest.mark.unit
+    def test_parses_bare_json(self):
+        """Current servers send the JSON payload on its own."""
+        result = tool_result(text='{"content_type": "book"}')
+        assert mcp_client._parse_result(result, mcp_client._ANALYZE_MARKER) == {"content_type": "book"}
+
+    @pytest.mark.unit
+    def test_strips_legacy_marker(self):
+        """Older servers put a marker line before the payload."""
+        result = tool_result(text=mcp_client._ANALYZE_MARKER + '{"size": 10}')
+        assert mcp_client._parse_result(result, mcp_client._ANALYZE_MARKER) == {"size": 10}
+
+    @pytest.mark.unit
+    def test_wraps_plain_text(self):
+        """Text without a JSON payload is returned as raw_response."""
+        result = tool_result(text="Error: server unavailable")
+        assert mcp_client._parse_result(result, mcp_client._ANALYZE_MARKER) == {
+            "raw_response": "Error: server unavailable"
+        }
+
+    @pytest.mark.unit
+    def test_empty_content(self):
+        """A result without content is wrapped as an empty raw_response."""
+        assert mcp_client._parse_result(tool_result(), mcp_client._SCRAPE_MARKER) == {"raw_response": ""}
+
+
+class TestFormatSize:
+    """Unit tests for human-readable sizes."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("size, expected", [
+        (0, "0.0 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (1024 ** 2 - 1, "1024.0 KB"),
+        (1024 ** 2, "1.0 MB"),
+        (5 * 1024 ** 3, "5.0 GB"),
+        (2 * 1024 ** 4, "2.0 TB"),
+        (3 * 1024 ** 5, "3072.0 TB"),
+    ])
+    def test_unit_boundaries(self, size, expected):
+        """Each unit starts at a power of 1024 and TB is the largest."""
+        assert YggdrasilMCPClient(server_path="unused")._format_size(size) == expected
+
+
+class FakeClient(YggdrasilMCPClient):
+    """Client whose tool calls succeed after a short await, without a server."""
+
+    def __init__(self, fail_urls=(), unanalyzable_urls=()):
+        super().__init__(server_path="unused")
+        self.fail_urls = set(fail_urls)
+        self.unanalyzable_urls = set(unanalyzable_urls)
+        self.scraped = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _call(self, url, **fields):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if url in self.fail_urls:
+                raise RuntimeError(f"boom: {url}")
+            return ProcessingResult(success=True, url=url, processing_time=0.5, **fields)
+        finally:
+            self.in_flight -= 1
+
+    async def analyze_url(self, url):
+        if url in self.unanalyzable_urls:
+            return ProcessingResult(success=False, url=url, error_message="analysis failed")
+        return await self._call(url, analysis={"url": url})
+
+    async def intelligent_scrape(self, url, force_analysis=False):
+        self.scraped.append(url)
+        return await self._call(url, storage_info={"url": url})
+
+
+class TestBatchProcessing:
+    """Unit tests for worker-pool batch processing."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self):
+        """Results line up with the input URLs."""
+        urls = [f"https://example.org/{i}" for i in range(25)]
+
+        results = await FakeClient().batch_process_urls(urls, max_concurrent=4)
+
+        assert [r.url for r in results] == urls
+        assert all(r.success and r.storage_info == {"url": r.url} for r in results)
+        assert results[0].processing_time == 1.0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """No more than max_concurrent URLs are in flight."""
+        client = FakeClient()
+        urls = [f"https://example.org/{i}" for i in range(25)]
+
+        await client.batch_process_urls(urls, max_concurrent=3)
+
+        assert client.max_in_flight <= 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_analysis_skips_scrape_by_default(self):
+        """A URL whose analysis fails is neither scraped nor stored."""
+        urls = ["https://example.org/ok", "https://example.org/unknown"]
+        client = FakeClient(unanalyzable_urls={urls[1]})
+
+        results = await client.batch_process_urls(urls)
+
+        assert client.scraped == [urls[0]]
+        assert [r.success for r in results] == [True, False]
+        assert results[1].error_message == "analysis failed"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failures_become_error_results(self):
+        """An exception for one URL becomes its error result."""
+        urls = ["https://example.org/ok", "https://example.org/bad"]
+
+        results = await FakeClient(fail_urls={urls[1]}).batch_process_urls(urls)
+
+        assert results[0].success
+        assert not results[1].success
+        assert "boom" in results[1].error_message
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_zero_concurrency_still_processes(self):
+        """max_concurrent=0 processes the batch with one worker."""
+        urls = ["https://example.org/a", "https://example.org/b"]
+
+        results = await FakeClient().batch_process_urls(urls, max_concurrent=0)
+
+        assert [r.url for r in results] == urls
+
+
+class PooledFakeClient(FakeClient):
+    """FakeClient that records connects, optionally failing after the first few."""
+
+    connects = 0
+    disconnects = 0
+    max_connects = None
+
+    async def connect(self):
+        cls = type(self)
+        if cls.max_connects is not None and cls.connects >= cls.max_connects:
+            raise ConnectionError("server failed to start")
+        cls.connects += 1
+        self.session = object()
+
+    async def disconnect(self):
+        if self.session is not None:
+            type(self).disconnects += 1
+        self.session = None
+
+
+@pytest.fixture
+def pooled_client(monkeypatch):
+    """Make pools create PooledFakeClients with fresh counters."""
+    client_class = type("PooledClient", (PooledFakeClient,), {})
+    monkeypatch.setattr(mcp_client, "YggdrasilMCPClient", lambda **kwargs: client_class())
+    return client_class
+
+
+class TestClientPool:
+    """Unit tests for the MCP client pool."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_batch_spreads_urls_and_keeps_order(self, pooled_client):
+        """URLs are split across the pool's clients and reassembled in order."""
+        pool = YggdrasilMCPClientPool(size=3)
+        urls = [f"https://example.org/{i}" for i in range(10)]
+
+        results = await pool.batch_process_urls(urls, max_concurrent=6)
+
+        assert [r.url for r in results] == urls
+        assert pooled_client.connects == 3
+        assert pool._idle.qsize() == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_empty_batch_connects_nothing(self, pooled_client):
+        """An empty batch returns without starting a server."""
+        pool = YggdrasilMCPClientPool(size=3)
+
+        assert await pool.batch_process_urls([]) == []
+        assert pooled_client.connects == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_connect_releases_acquired_clients(self, pooled_client):
+        """Clients acquired before a connect failure go back to the pool."""
+        pooled_client.max_connects = 1
+        pool = YggdrasilMCPClientPool(size=3)
+
+        with pytest.raises(ConnectionError):
+            await pool.batch_process_urls(["https://example.org/a", "https://example.org/b"])
+
+        assert pool._idle.qsize() == 1
+
+        # The pool can still fill its remaining slots once servers start
+        pooled_client.max_connects = None
+        results = await pool.batch_process_urls(["https://example.org/a", "https://example.org/b"])
+        assert [r.success for r in results] == [True, True]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_close_disconnects_borrowed_clients(self, pooled_client):
+        """close() disconnects borrowed clients, which are dropped on release."""
+        pool = YggdrasilMCPClientPool(size=2)
+        idle = await pool.acquire()
+        borrowed = await pool.acquire()
+        pool.release(idle)
+
+        await pool.close()
+        pool.release(borrowed)
+
+        assert idle.session is None and borrowed.session is None
+        assert pool._idle.empty()
+
+
+class TestDefaultPool:
+    """Unit tests for the convenience functions' connection handling."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_one_shot_call_disconnects(self, pooled_client):
+        """Outside default_pool(), each call shuts its server down before returning."""
+        result = await mcp_client.quick_analyze("https://example.org/a")
+        await mcp_client.batch_smart_scrape(["https://example.org/b", "https://example.org/c"])
+
+        assert result.success
+        assert pooled_client.disconnects == pooled_client.connects == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_block_reuses_connection_until_exit(self, pooled_client):
+        """Inside default_pool(), calls share a connection that closes with the block."""
+        async with mcp_client.default_pool(size=1) as pool:
+            await mcp_client.quick_analyze("https://example.org/a")
+            await mcp_client.smart_scrape("https://example.org/a")
+            async with mcp_client.default_pool() as inner:
+                assert inner is pool
+            assert pooled_client.disconnects == 0
+
+        assert pooled_client.connects == pooled_client.disconnects == 1
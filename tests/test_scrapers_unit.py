@@ -0,0 +1,323 @@
+"""Unit tests for scraper parsing helpers."""
+
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+GITA_CHAPTER_HTML = """
+<html><body>
+<div class="verse-nav" data-verse="9"><div class="link">Next chapter</div></div>
+<div id="verse-jump-18"><div class="link">Jump to the last verse</div></div>
+<div data-class="verse" data-verse="7"><div class="translation">Bookmarked verse</div></div>
+<div class="verse" data-verse="1">
+  <span class="verse-number">Verse 1</span>
+  <div class="sanskrit">धर्मक्षेत्रे कुरुक्षेत्रे समवेता युयुत्सवः</div>
+  <div class="translation">Dhritarashtra said: O Sanjay, what did my sons do?</div>
+  <div class="commentary">The Gita opens with a question from the blind king.</div>
+</div>
+<div class="sloka" id="verse-2">
+  <div class="text-block">Sanjay said: Seeing the Pandava army arrayed, King Duryodhan spoke.</div>
+</div>
+</body></html>
+"""
+
+GITA_ID_ONLY_HTML = """
+<html><body>
+<div data-id="verse-7"><div class="translation">Bookmarked verse</div></div>
+<div id="verse-5">
+  <div class="translation">Those who see action in inaction are wise.</div>
+</div>
+</body></html>
+"""
+
+
+@pytest.fixture
+def hindu_scraper():
+    """HinduTextsScraper factory that never touches the database or network."""
+    from yggdrasil.scraping.hindu_texts_scraper import HinduTextsScraper
+
+    def make(extraction_mode='dom'):
+        return HinduTextsScraper(MagicMock(), extraction_mode=extraction_mode)
+
+    return make
+
+
+class TestRateLimiter:
+    """Unit tests for the token-bucket rate limiter."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_burst_then_waits_for_refill(self):
+        """A full bucket allows ``rate`` immediate acquisitions, then paces the rest."""
+        from yggdrasil.scraping.base_scraper import RateLimiter
+
+        limiter = RateLimiter(2, 0.2)
+
+        start = time.monotonic()
+        await limiter.acquire()
+        async with limiter:
+            pass
+        burst = time.monotonic() - start
+
+        await limiter.acquire()
+        paced = time.monotonic() - start
+
+        assert burst < 0.05
+        assert paced >= 0.09
+
+
+class TestGitaVerseExtraction:
+    """Unit tests for Bhagavad Gita verse extraction."""
+
+    @pytest.mark.unit
+    def test_dom_extracts_verse_parts(self, hindu_scraper):
+        """Each part comes from its own element in a single traversal."""
+        verses = dict(hindu_scraper()._iter_gita_verses_dom(GITA_CHAPTER_HTML))
+
+        assert set(verses) == {1, 2}
+        assert verses[1] == {
+            'sanskrit': 'धर्मक्षेत्रे कुरुक्षेत्रे समवेता युयुत्सवः',
+            'english': 'Dhritarashtra said: O Sanjay, what did my sons do?',
+            'commentary': 'The Gita opens with a question from the blind king.',
+        }
+
+    @pytest.mark.unit
+    def test_dom_falls_back_to_container_text(self, hindu_scraper):
+        """A verse without part elements uses its whole text for the detected language."""
+        verses = dict(hindu_scraper()._iter_gita_verses_dom(GITA_CHAPTER_HTML))
+
+        assert verses[2] == {
+            'english': 'Sanjay said: Seeing the Pandava army arrayed, King Duryodhan spoke.',
+        }
+
+    @pytest.mark.unit
+    def test_regex_matches_dom(self, hindu_scraper):
+        """Regex mode selects the same containers and parts as DOM mode."""
+        dom = hindu_scraper()
+        regex = hindu_scraper('regex')
+
+        assert list(regex._iter_gita_verses_regex(GITA_CHAPTER_HTML)) == \
+            list(dom._iter_gita_verses_dom(GITA_CHAPTER_HTML))
+
+    @pytest.mark.unit
+    def test_regex_ignores_partial_class_tokens(self, hindu_scraper):
+        """Classes such as ``verse-nav`` are not verse containers."""
+        verses = dict(hindu_scraper('regex')._iter_gita_verses_regex(GITA_CHAPTER_HTML))
+
+        assert 9 not in verses
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('html', [GITA_CHAPTER_HTML, GITA_ID_ONLY_HTML], ids=['class', 'id'])
+    def test_regex_ignores_data_attributes(self, hindu_scraper, html):
+        """``data-class`` and ``data-id`` attributes do not mark verse containers."""
+        verses = dict(hindu_scraper('regex')._iter_gita_verses_regex(html))
+
+        assert 7 not in verses
+
+    @pytest.mark.unit
+    def test_regex_falls_back_to_container_id(self, hindu_scraper):
+        """Without class-marked containers, verses are found by id as in DOM mode."""
+        dom = hindu_scraper()
+        regex = hindu_scraper('regex')
+
+        verses = list(regex._iter_gita_verses_regex(GITA_ID_ONLY_HTML))
+
+        assert verses == [(5, {'english': 'Those who see action in inaction are wise.'})]
+        assert verses == list(dom._iter_gita_verses_dom(GITA_ID_ONLY_HTML))
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('html', [GITA_CHAPTER_HTML, GITA_ID_ONLY_HTML], ids=['class', 'id'])
+    async def test_stream_matches_dom(self, hindu_scraper, html):
+        """Stream mode selects the same containers and parts as DOM mode."""
+        scraper = hindu_scraper('stream')
+
+        async def stream_page(url):
+            # Split mid-element so text nodes span feed() calls
+            for start in range(0, len(html), 7):
+                yield html[start:start + 7]
+
+        with patch.object(scraper, 'stream_page', stream_page):
+            verses = await scraper._stream_gita_verses('https://example.org/chapter/1')
+
+        assert verses == list(hindu_scraper()._iter_gita_verses_dom(html))
+
+
+class TestBookChunking:
+    """Unit tests for splitting book text into chunks."""
+
+    @pytest.fixture
+    def split(self):
+        from yggdrasil.scraping.yggdrasil_manager import YggdrasilScrapingManager
+
+        return lambda text, size: YggdrasilScrapingManager._split_text_into_chunks(None, text, size)
+
+    @pytest.mark.unit
+    def test_breaks_on_spaces(self, split):
+        """Chunks end at the last space that fits in the window."""
+        assert split("alpha beta gamma delta", 11) == ["alpha beta", "gamma delta"]
+
+    @pytest.mark.unit
+    def test_breaks_on_any_whitespace(self, split):
+        """Newlines and tabs are chunk boundaries too."""
+        assert split("line1\nline2\nline3\nline4", 6) == ["line1", "line2", "line3", "line4"]
+        assert split("col1\tcol2\tcol3", 5) == ["col1", "col2", "col3"]
+
+    @pytest.mark.unit
+    def test_overlong_word_gets_own_chunk(self, split):
+        """A word longer than the window is kept whole."""
+        assert split("tiny supercalifragilistic end", 6) == ["tiny", "supercalifragilistic", "end"]
+
+    @pytest.mark.unit
+    def test_short_text_is_one_chunk(self, split):
+        """Text within the window is returned unchanged."""
+        assert split("short text", 100) == ["short text"]
+
+
+class TestScrapingManagerLifecycle:
+    """Unit tests for the Yggdrasil scraping manager's lifecycle."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_context_closes_scraper_clients(self):
+        """Leaving the block closes the book and academic scrapers' HTTP clients."""
+        from yggdrasil.scraping.yggdrasil_manager import YggdrasilScrapingManager
+
+        manager = YggdrasilScrapingManager.__new__(YggdrasilScrapingManager)
+        manager.book_scraper = MagicMock(aclose=AsyncMock())
+        manager.academic_scraper = MagicMock(aclose=AsyncMock())
+
+        with patch.object(YggdrasilScrapingManager, 'initialize', AsyncMock()) as initialize:
+            async with manager as entered:
+                assert entered is manager
+                initialize.assert_awaited_once()
+                manager.book_scraper.aclose.assert_not_awaited()
+
+        manager.book_scraper.aclose.assert_awaited_once()
+        manager.academic_scraper.aclose.assert_awaited_once()
+
+
+QURAN_COM_SURAH_HTML = """
+<html><body>
+<div class="verse-container">
+  <span class="verse-number">1</span>
+  <div class="arabic-text">بِسْمِ ٱللَّهِ ٱلرَّحْمَٰنِ ٱلرَّحِيمِ</div>
+  <div class="translation" data-translation="en.sahih">In the name of Allah, the Entirely Merciful.</div>
+  <div class="translation" data-translation="en.pickthall">In the name of Allah, the Beneficent.</div>
+</div>
+<div class="verse-container">
+  <span class="verse-number">2</span>
+  <div class="arabic-text">ٱلْحَمْدُ لِلَّهِ رَبِّ ٱلْعَٰلَمِينَ</div>
+  <div class="translation" data-translation="en.sahih">All praise is due to Allah.</div>
+</div>
+</body></html>
+"""
+
+
+@pytest.fixture
+def quran_scraper():
+    """QuranScraper that never touches the database or network."""
+    from yggdrasil.scraping.quran_scraper import QuranScraper
+
+    return QuranScraper(MagicMock())
+
+
+class TestQuranVerseExtraction:
+    """Unit tests for Quran.com verse extraction."""
+
+    @pytest.fixture
+    def tree(self):
+        import lxml.html
+
+        return lxml.html.fromstring(QURAN_COM_SURAH_HTML)
+
+    @pytest.mark.unit
+    def test_arabic_only(self, quran_scraper, tree):
+        """Without translations, one Arabic text is built per verse."""
+        texts = quran_scraper._extract_verses(tree, 1, "https://quran.com/1")
+
+        assert [(t.title, t.verse) for t in texts] == [("Al-Fatiha 1:1", 1), ("Al-Fatiha 1:2", 2)]
+        assert all(t.metadata['text_type'] == 'original_arabic' for t in texts)
+        assert texts[0].metadata is not texts[1].metadata
+
+    @pytest.mark.unit
+    def test_arabic_matches_with_translations(self, quran_scraper, tree):
+        """Arabic texts are the same whether or not translations are extracted."""
+        arabic_only = quran_scraper._extract_verses(tree, 1, "https://quran.com/1")
+        mixed = quran_scraper._extract_verses(
+            tree, 1, "https://quran.com/1", translations=["en.sahih", "en.pickthall"]
+        )
+
+        assert [t for t in mixed if t.translator is None] == arabic_only
+
+    @pytest.mark.unit
+    def test_identifies_requested_translations(self, quran_scraper, tree):
+        """Each translation block is attributed to the requested id it carries."""
+        texts = quran_scraper._extract_verses(
+            tree, 1, "https://quran.com/1:1",
+            include_arabic=False,
+            translations=["en.sahih", "en.pickthall"],
+            verse_filter=lambda verse_num: verse_num == 1,
+        )
+
+        assert [(t.title, t.translator) for t in texts] == [
+            ("Al-Fatiha 1:1 (en.sahih)", "en.sahih"),
+            ("Al-Fatiha 1:1 (en.pickthall)", "en.pickthall"),
+        ]
+
+    @pytest.mark.unit
+    def test_single_translation_page(self, quran_scraper, tree):
+        """A page requested for one translation labels every block with it."""
+        texts = quran_scraper._extract_verses(
+            tree, 1, "https://quran.com/1?translations=en.sahih",
+            include_arabic=False,
+            translation="en.sahih",
+        )
+
+        assert {t.translator for t in texts} == {"en.sahih"}
+        assert len(texts) == 3
+
+
+TANZIL_SURAH_HTML = """
+<html><body><div class="surah">
+<span class="verse" data-verse="1">بِسْمِ ٱللَّهِ <span class="ayah-number">١</span></span>
+<span class="verse" data-verse="2">ٱلْحَمْدُ لِلَّهِ</span>
+<span class="verse" data-verse="x">not a verse number</span>
+<span class="note">Footnote</span>
+</div></body></html>
+"""
+
+
+class TestTanzilStreaming:
+    """Unit tests for the Tanzil pull parser."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_parses_verses_across_chunks(self, quran_scraper):
+        """Verses split across stream chunks are parsed whole, skipping bad numbers."""
+        async def stream_page(url):
+            for start in range(0, len(TANZIL_SURAH_HTML), 5):
+                yield TANZIL_SURAH_HTML[start:start + 5]
+
+        with patch.object(quran_scraper, 'stream_page', stream_page):
+            texts = await quran_scraper._scrape_from_tanzil(1, [], include_arabic=True)
+
+        assert [(t.verse, t.content) for t in texts] == [
+            (1, 'بِسْمِ ٱللَّهِ١'),
+            (2, 'ٱلْحَمْدُ لِلَّهِ'),
+        ]
+        assert all(t.metadata['source'] == 'Tanzil.net' for t in texts)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_skips_arabic_when_not_requested(self, quran_scraper):
+        """No request is made when Arabic text is not wanted."""
+        stream_page = MagicMock()
+
+        with patch.object(quran_scraper, 'stream_page', stream_page):
+            texts = await quran_scraper._scrape_from_tanzil(1, [], include_arabic=False)
+
+        assert texts == []
+        stream_page.assert_not_called()
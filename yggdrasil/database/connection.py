@@ -3,8 +3,9 @@
 import asyncio
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 from sqlalchemy import create_engine, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, Session
@@ -17,6 +18,11 @@ from .qdrant_manager import qdrant_manager
 logger = logging.getLogger(__name__)
 
 
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB column values with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class DatabaseManager:
     """Manages database connections and sessions for hybrid PostgreSQL + Qdrant architecture."""
     
@@ -27,6 +33,8 @@ class DatabaseManager:
             echo=settings.debug,
             pool_pre_ping=True,
             pool_recycle=3600,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
         )
         
         # Async engine for application
@@ -36,6 +44,8 @@ class DatabaseManager:
             echo=settings.debug,
             pool_pre_ping=True,
             pool_recycle=3600,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
         )
         
         # Session factories
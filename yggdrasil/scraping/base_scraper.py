@@ -2,8 +2,10 @@
 
 import asyncio
 import logging
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from asyncio import Semaphore
@@ -14,8 +16,31 @@ from fake_useragent import UserAgent
 from yggdrasil.database.models import YggdrasilText, TextType, Language
 from ..database.connection import DatabaseManager
 
+try:
+    import brotli  # noqa: F401  (enables httpx Brotli decoding)
+    ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
 
-@dataclass
+
+# Text normalization patterns shared by all scrapers
+HTML_ENTITIES = {
+    '&nbsp;': ' ',
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&#39;': "'",
+}
+HTML_ENTITY_PATTERN = re.compile('|'.join(map(re.escape, HTML_ENTITIES)))
+VERSE_REFERENCE_PATTERN = re.compile(r'(\w+(?:\s+\w+)*)\s+(\d+):(\d+)')
+
+
+def _replace_html_entity(match: re.Match) -> str:
+    return HTML_ENTITIES[match.group()]
+
+
+@dataclass(slots=True)
 class ScrapedText:
     """Data class for scraped spiritual text."""
     title: str
@@ -31,6 +56,39 @@ class ScrapedText:
     metadata: Optional[Dict[str, Any]] = None
 
 
+class RateLimiter:
+    """Token-bucket rate limiter allowing ``rate`` acquisitions per ``period`` seconds."""
+    
+    def __init__(self, rate: float, period: float = 1.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self._last_refill
+                self._tokens = min(self.rate, self._tokens + elapsed * self.rate / self.period)
+                self._last_refill = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
 class BaseScraper(ABC):
     """Base class for all spiritual text scrapers with rate limiting."""
     
@@ -42,22 +100,43 @@ class BaseScraper(ABC):
         
         # Rate limiting
         self.rate_limiter = Semaphore(max_concurrent)  # Max concurrent requests
-        self.request_delay = request_delay  # Delay between requests
+        self.request_delay = request_delay  # Window for max_concurrent requests
+        self.request_limiter = RateLimiter(max_concurrent, request_delay) if request_delay > 0 else None
         self.max_retries = 3  # Maximum retry attempts
         
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = httpx.AsyncClient(
-            headers={'User-Agent': self.ua.random},
-            timeout=30.0,
-            follow_redirects=True
-        )
+        self._get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        await self.aclose()
+    
+    def _get_session(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self.session is None:
+            # One pooled client per scraper so keep-alive connections are reused
+            self.session = httpx.AsyncClient(
+                headers={
+                    'User-Agent': self.ua.random,
+                    'Accept-Encoding': ACCEPT_ENCODING,
+                },
+                timeout=30.0,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=30.0
+                )
+            )
+        return self.session
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
         if self.session:
             await self.session.aclose()
+            self.session = None
     
     @abstractmethod
     async def scrape_texts(self, **kwargs) -> List[ScrapedText]:
@@ -69,12 +148,17 @@ class BaseScraper(ABC):
         """Get list of supported text types."""
         pass
     
+    async def _wait_for_request_slot(self) -> None:
+        """Wait until the shared request budget allows another request."""
+        if self.request_limiter:
+            await self.request_limiter.acquire()
+    
     async def fetch_page(self, url: str, **kwargs) -> str:
         """Fetch a web page with error handling."""
         async with self.rate_limiter:
-            await asyncio.sleep(self.request_delay)
+            await self._wait_for_request_slot()
             try:
-                response = await self.session.get(url, **kwargs)
+                response = await self._get_session().get(url, **kwargs)
                 response.raise_for_status()
                 return response.text
             except httpx.HTTPError as e:
@@ -84,6 +168,19 @@ class BaseScraper(ABC):
                 self.logger.error(f"Error fetching {url}: {e}")
                 raise
     
+    async def stream_page(self, url: str, **kwargs) -> AsyncIterator[str]:
+        """Stream a web page as decoded text chunks, with the same limits as fetch_page."""
+        async with self.rate_limiter:
+            await self._wait_for_request_slot()
+            try:
+                async with self._get_session().stream('GET', url, **kwargs) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_text():
+                        yield chunk
+            except httpx.HTTPError as e:
+                self.logger.error(f"HTTP error streaming {url}: {e}")
+                raise
+    
     def parse_html(self, html: str, parser: str = 'html.parser') -> BeautifulSoup:
         """Parse HTML content."""
         return BeautifulSoup(html, parser)
@@ -156,26 +253,17 @@ class BaseScraper(ABC):
         if not text:
             return ""
         
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        # Remove common HTML entities
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&quot;', '"')
-        text = text.replace('&#39;', "'")
+        # Replace common HTML entities in a single pass
+        if '&' in text:
+            text = HTML_ENTITY_PATTERN.sub(_replace_html_entity, text)
         
-        return text.strip()
+        # Remove extra whitespace
+        return ' '.join(text.split())
     
     def extract_verse_reference(self, text: str) -> Tuple[Optional[str], Optional[int], Optional[int]]:
         """Extract book, chapter, and verse from reference text."""
-        import re
-        
         # Pattern for "Book Chapter:Verse" format
-        pattern = r'(\w+(?:\s+\w+)*)\s+(\d+):(\d+)'
-        match = re.search(pattern, text)
+        match = VERSE_REFERENCE_PATTERN.search(text)
         
         if match:
             book = match.group(1).strip()
@@ -1,14 +1,24 @@
 """Hindu texts scraper for Bhagavad Gita, Upanishads, and other Hindu scriptures."""
 
-import asyncio
+import html as html_lib
 import re
-from typing import List, Dict, Optional, Any
+from dataclasses import replace
+from typing import List, Dict, Optional, Any, Iterator, Tuple
 from urllib.parse import urljoin
 
-from .base_scraper import BaseScraper, ScrapedText
+from lxml import etree
+
+from .base_scraper import BaseScraper, ScrapedText, RateLimiter
 from ..database.models import TextType, Language
 
 
+class _ChapterNames(dict):
+    """Chapter-name table that falls back to a generic name for unknown chapters."""
+    
+    def __missing__(self, chapter: int) -> str:
+        return f"Chapter {chapter}"
+
+
 class HinduTextsScraper(BaseScraper):
     """Scraper for Hindu spiritual texts."""
     
@@ -17,7 +27,7 @@ class HinduTextsScraper(BaseScraper):
     VEDABASE_BASE = "https://vedabase.io"
     
     # Bhagavad Gita chapters
-    GITA_CHAPTERS = {
+    GITA_CHAPTERS = _ChapterNames({
         1: "Arjuna's Dilemma", 2: "Sankhya Yoga", 3: "Karma Yoga",
         4: "Jnana Yoga", 5: "Karma Vairagya Yoga", 6: "Abhyasa Yoga",
         7: "Paramahamsa Vijnana Yoga", 8: "Aksara Parabrahma Yoga",
@@ -26,7 +36,7 @@ class HinduTextsScraper(BaseScraper):
         13: "Ksetra Ksetrajna Vibhaga Yoga", 14: "Gunatraya Vibhaga Yoga",
         15: "Purusottama Yoga", 16: "Daivasura Sampad Vibhaga Yoga",
         17: "Sraddhatraya Vibhaga Yoga", 18: "Moksa Opadesa Yoga"
-    }
+    })
     
     # Major Upanishads
     UPANISHADS = [
@@ -35,6 +45,84 @@ class HinduTextsScraper(BaseScraper):
         "Svetasvatara", "Kaushitaki", "Mahanarayana"
     ]
     
+    # Source URLs precomputed for the known chapters and Upanishads
+    GITA_CHAPTER_URLS = tuple(map(f"{BHAGAVAD_GITA_BASE}/chapter/{{}}".format, range(1, 19)))
+    UPANISHAD_URLS = dict(zip(
+        UPANISHADS,
+        map(f"{UPANISHADS_BASE}/upan/{{}}.htm".format, map(str.lower, UPANISHADS))
+    ))
+    
+    # Class patterns identifying the parts of a Gita verse container
+    VERSE_PART_TAGS = frozenset({'div', 'span', 'p'})
+    VERSE_PART_PATTERNS = (
+        ('sanskrit', re.compile(r'sanskrit|devanagari')),
+        ('english', re.compile(r'translation|english')),
+        ('commentary', re.compile(r'commentary|purport|explanation')),
+    )
+    
+    # Raw-HTML patterns for the regex extraction mode; containers are matched like
+    # DOM mode: by a whole 'verse'/'sloka' class token, else by id as a fallback
+    GITA_VERSE_BLOCK = re.compile(
+        r'<div(?P<attrs>[^>]*\sclass="(?:[^"]*\s)?(?-i:verse|sloka)(?:\s[^"]*)?"[^>]*)>'
+        r'(?P<body>.*?)</div>\s*</div>',
+        re.DOTALL | re.IGNORECASE
+    )
+    GITA_VERSE_ID_BLOCK = re.compile(
+        r'<div(?P<attrs>[^>]*\sid="[^"]*(?-i:verse|sloka)[^"]*"[^>]*)>(?P<body>.*?)</div>\s*</div>',
+        re.DOTALL | re.IGNORECASE
+    )
+    GITA_VERSE_NUMBER_BLOCK = re.compile(
+        r'\sclass="[^"]*(?:verse[^"]*num|num[^"]*verse)[^"]*"[^>]*>(.*?)</',
+        re.DOTALL | re.IGNORECASE
+    )
+    GITA_VERSE_PART_BLOCKS = (
+        ('sanskrit', re.compile(
+            r'<(div|span|p)\b[^>]*\sclass="[^"]*(?:sanskrit|devanagari)[^"]*"[^>]*>(.*?)(?:</\1>|\Z)',
+            re.DOTALL | re.IGNORECASE
+        )),
+        ('english', re.compile(
+            r'<(div|span|p)\b[^>]*\sclass="[^"]*(?:translation|english)[^"]*"[^>]*>(.*?)(?:</\1>|\Z)',
+            re.DOTALL | re.IGNORECASE
+        )),
+        ('commentary', re.compile(
+            r'<(div|span|p)\b[^>]*\sclass="[^"]*(?:commentary|purport|explanation)[^"]*"[^>]*>(.*?)(?:</\1>|\Z)',
+            re.DOTALL | re.IGNORECASE
+        )),
+    )
+    DATA_VERSE_ATTR = re.compile(r'\bdata-verse="(\d+)"')
+    VERSE_NUMBER_CLASS = re.compile(r'verse.*num|num.*verse')
+    VERSE_CONTAINER_ID = re.compile(r'verse|sloka')
+    VERSE_ID_ATTR = re.compile(r'\sid="[^"]*verse[^"]*?(\d+)')
+    HTML_TAG = re.compile(r'<[^>]+>')
+    
+    # Navigation text on sacred-texts.com pages
+    NAVIGATION_SKIP_PATTERN = re.compile(r'next|previous|index|contents', re.IGNORECASE)
+    NAVIGATION_SKIP_WINDOW = 200
+    
+    # Script detection patterns
+    DEVANAGARI_PATTERN = re.compile(r'[\u0900-\u097F]+')
+    SANSKRIT_TRANSLITERATION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+        r'[aeiou]m\b',  # Common Sanskrit endings
+        r'[kg]h[aeiou]',  # Aspirated consonants
+        r'[td]h[aeiou]',
+        r'[pb]h[aeiou]',
+        r'[rl]i\b',
+        r'[aeiou]h\b'
+    ))
+    
+    def __init__(self, *args, extraction_mode: str = 'dom', **kwargs):
+        super().__init__(*args, **kwargs)
+        
+        # 'dom' parses pages with BeautifulSoup; 'regex' scans raw Gita HTML directly;
+        # 'stream' feeds Gita pages to an incremental lxml parser as they download
+        if extraction_mode not in ('dom', 'regex', 'stream'):
+            raise ValueError(f"Unsupported extraction mode: {extraction_mode}")
+        self.extraction_mode = extraction_mode
+        
+        # Per-site request budgets instead of fixed delays between requests
+        self._gita_limiter = RateLimiter(5, 1.0)
+        self._upanishad_limiter = RateLimiter(3, 1.0)
+    
     def get_supported_text_types(self) -> List[TextType]:
         """Get supported text types."""
         return [TextType.BHAGAVAD_GITA, TextType.UPANISHADS]
@@ -62,9 +150,6 @@ class HinduTextsScraper(BaseScraper):
                 
                 scraped_texts.extend(texts)
                 
-                # Add delay between different text types
-                await asyncio.sleep(2)
-                
             except Exception as e:
                 self.logger.error(f"Error scraping {text_type}: {e}")
                 continue
@@ -85,9 +170,6 @@ class HinduTextsScraper(BaseScraper):
                 chapter_texts = await self._scrape_gita_chapter(chapter, include_sanskrit)
                 texts.extend(chapter_texts)
                 
-                # Add delay between chapters
-                await asyncio.sleep(1)
-                
             except Exception as e:
                 self.logger.error(f"Error scraping Gita chapter {chapter}: {e}")
                 continue
@@ -98,82 +180,70 @@ class HinduTextsScraper(BaseScraper):
                                  chapter: int,
                                  include_sanskrit: bool) -> List[ScrapedText]:
         """Scrape a specific Bhagavad Gita chapter."""
-        chapter_name = self.GITA_CHAPTERS.get(chapter, f"Chapter {chapter}")
-        url = f"{self.BHAGAVAD_GITA_BASE}/chapter/{chapter}"
+        chapter_name = self.GITA_CHAPTERS[chapter]
+        url = self._gita_chapter_url(chapter)
         
         try:
-            html = await self.fetch_page(url)
-            soup = self.parse_html(html)
-            
-            texts = []
+            async with self._gita_limiter:
+                if self.extraction_mode == 'stream':
+                    verses = await self._stream_gita_verses(url)
+                else:
+                    html = await self.fetch_page(url)
             
-            # Find verse containers
-            verse_containers = soup.find_all('div', class_=['verse', 'sloka'])
+            if self.extraction_mode == 'regex':
+                verses = self._iter_gita_verses_regex(html)
+            elif self.extraction_mode == 'dom':
+                verses = self._iter_gita_verses_dom(html)
             
-            if not verse_containers:
-                # Try alternative selectors
-                verse_containers = soup.find_all('div', id=re.compile(r'verse|sloka'))
+            texts = []
+            base_metadata = {
+                'chapter_name': chapter_name,
+                'source': 'Holy Bhagavad Gita'
+            }
             
-            for container in verse_containers:
-                verse_num = self._extract_gita_verse_number(container)
-                if not verse_num:
-                    continue
+            for verse_num, parts in verses:
+                # Fields shared by every text produced for this verse
+                base = ScrapedText(
+                    title=f"Bhagavad Gita {chapter}.{verse_num}",
+                    content='',
+                    text_type=TextType.BHAGAVAD_GITA,
+                    language=Language.ENGLISH,
+                    book="Bhagavad Gita",
+                    chapter=chapter,
+                    verse=verse_num,
+                    source_url=url,
+                    metadata=base_metadata
+                )
                 
                 # Extract Sanskrit if available and requested
                 if include_sanskrit:
-                    sanskrit_text = self._extract_sanskrit_text(container)
+                    sanskrit_text = parts.get('sanskrit')
                     if sanskrit_text:
-                        texts.append(ScrapedText(
-                            title=f"Bhagavad Gita {chapter}.{verse_num} (Sanskrit)",
+                        texts.append(replace(
+                            base,
+                            title=f"{base.title} (Sanskrit)",
                             content=self.clean_text(sanskrit_text),
-                            text_type=TextType.BHAGAVAD_GITA,
                             language=Language.SANSKRIT,
-                            book="Bhagavad Gita",
-                            chapter=chapter,
-                            verse=verse_num,
-                            source_url=url,
-                            metadata={
-                                'chapter_name': chapter_name,
-                                'text_type': 'original_sanskrit',
-                                'source': 'Holy Bhagavad Gita'
-                            }
+                            metadata={**base_metadata, 'text_type': 'original_sanskrit'}
                         ))
                 
                 # Extract English translation
-                english_text = self._extract_english_translation(container)
+                english_text = parts.get('english')
                 if english_text:
-                    texts.append(ScrapedText(
-                        title=f"Bhagavad Gita {chapter}.{verse_num}",
+                    texts.append(replace(
+                        base,
                         content=self.clean_text(english_text),
-                        text_type=TextType.BHAGAVAD_GITA,
-                        language=Language.ENGLISH,
-                        book="Bhagavad Gita",
-                        chapter=chapter,
-                        verse=verse_num,
-                        source_url=url,
-                        metadata={
-                            'chapter_name': chapter_name,
-                            'source': 'Holy Bhagavad Gita'
-                        }
+                        metadata=dict(base_metadata)
                     ))
                 
                 # Extract commentary if available
-                commentary = self._extract_commentary(container)
+                commentary = parts.get('commentary')
                 if commentary:
-                    texts.append(ScrapedText(
-                        title=f"Bhagavad Gita {chapter}.{verse_num} (Commentary)",
+                    texts.append(replace(
+                        base,
+                        title=f"{base.title} (Commentary)",
                         content=self.clean_text(commentary),
-                        text_type=TextType.BHAGAVAD_GITA,
-                        language=Language.ENGLISH,
-                        book="Bhagavad Gita",
-                        chapter=chapter,
-                        verse=verse_num,
-                        source_url=url,
-                        metadata={
-                            'chapter_name': chapter_name,
-                            'text_type': 'commentary',
-                            'source': 'Holy Bhagavad Gita'
-                        }
+                        metadata={**base_metadata, 'text_type': 'commentary'}
                     ))
             
             return texts
@@ -196,9 +266,6 @@ class HinduTextsScraper(BaseScraper):
                 upanishad_texts = await self._scrape_single_upanishad(upanishad, include_sanskrit)
                 texts.extend(upanishad_texts)
                 
-                # Add delay between Upanishads
-                await asyncio.sleep(1)
-                
             except Exception as e:
                 self.logger.error(f"Error scraping Upanishad {upanishad}: {e}")
                 continue
@@ -209,12 +276,11 @@ class HinduTextsScraper(BaseScraper):
                                      upanishad: str,
                                      include_sanskrit: bool) -> List[ScrapedText]:
         """Scrape a single Upanishad."""
-        # Sacred-texts.com URL structure
-        upanishad_lower = upanishad.lower()
-        url = f"{self.UPANISHADS_BASE}/upan/{upanishad_lower}.htm"
+        url = self._upanishad_url(upanishad)
         
         try:
-            html = await self.fetch_page(url)
+            async with self._upanishad_limiter:
+                html = await self.fetch_page(url)
             soup = self.parse_html(html)
             
             texts = []
@@ -240,8 +306,8 @@ class HinduTextsScraper(BaseScraper):
                 if not text_content or len(text_content) < 20:
                     continue
                 
-                # Skip navigation and header text
-                if any(skip in text_content.lower() for skip in ['next', 'previous', 'index', 'contents']):
+                # Skip navigation and header text (navigation words lead the paragraph)
+                if self.NAVIGATION_SKIP_PATTERN.search(text_content, 0, self.NAVIGATION_SKIP_WINDOW):
                     continue
                 
                 # Determine if this is Sanskrit or English
@@ -287,6 +353,90 @@ class HinduTextsScraper(BaseScraper):
             self.logger.error(f"Error scraping {upanishad} Upanishad: {e}")
             return []
     
+    def _gita_chapter_url(self, chapter: int) -> str:
+        """Get the Holy Bhagavad Gita URL for a chapter."""
+        if 1 <= chapter <= len(self.GITA_CHAPTER_URLS):
+            return self.GITA_CHAPTER_URLS[chapter - 1]
+        return f"{self.BHAGAVAD_GITA_BASE}/chapter/{chapter}"
+    
+    def _upanishad_url(self, upanishad: str) -> str:
+        """Get the sacred-texts.com URL for an Upanishad."""
+        url = self.UPANISHAD_URLS.get(upanishad)
+        if url is None:
+            url = f"{self.UPANISHADS_BASE}/upan/{upanishad.lower()}.htm"
+        return url
+    
+    def _iter_gita_verses_dom(self, html: str) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """Yield verse numbers and parts from a parsed Gita chapter page."""
+        soup = self.parse_html(html)
+        
+        # Find verse containers
+        verse_containers = soup.find_all('div', class_=['verse', 'sloka'])
+        
+        if not verse_containers:
+            # Try alternative selectors
+            verse_containers = soup.find_all('div', id=re.compile(r'verse|sloka'))
+        
+        for container in verse_containers:
+            verse_num = self._extract_gita_verse_number(container)
+            if not verse_num:
+                continue
+            
+            yield verse_num, self._extract_verse_parts(container)
+    
+    async def _stream_gita_verses(self, url: str) -> List[Tuple[int, Dict[str, str]]]:
+        """Parse a Gita chapter page incrementally while it downloads."""
+        parser = etree.HTMLParser(target=_GitaVerseTarget(self))
+        
+        async for chunk in self.stream_page(url):
+            parser.feed(chunk)
+        
+        return parser.close()
+    
+    def _iter_gita_verses_regex(self, html: str) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """Yield verse numbers and parts by scanning raw Gita chapter HTML."""
+        blocks = list(self.GITA_VERSE_BLOCK.finditer(html))
+        if not blocks:
+            # Try alternative selectors
+            blocks = self.GITA_VERSE_ID_BLOCK.finditer(html)
+        
+        for block in blocks:
+            attrs, body = block.group('attrs'), block.group('body')
+            
+            verse_num = self._extract_gita_verse_number_regex(attrs, body)
+            if not verse_num:
+                continue
+            
+            parts: Dict[str, str] = {}
+            for part, pattern in self.GITA_VERSE_PART_BLOCKS:
+                match = pattern.search(body)
+                if match:
+                    parts[part] = self._strip_html(match.group(2))
+            
+            # Without dedicated elements, fall back to the block text
+            if 'sanskrit' not in parts or 'english' not in parts:
+                self._apply_verse_text_fallback(parts, self._strip_html(body))
+            
+            yield verse_num, parts
+    
+    def _extract_gita_verse_number_regex(self, attrs: str, body: str) -> Optional[int]:
+        """Extract verse number from a raw verse block's attributes and markup."""
+        match = self.GITA_VERSE_NUMBER_BLOCK.search(body)
+        if match:
+            number = re.search(r'(\d+)', self._strip_html(match.group(1)))
+            if number:
+                return int(number.group(1))
+        
+        match = self.DATA_VERSE_ATTR.search(attrs) or self.VERSE_ID_ATTR.search(attrs)
+        if match:
+            return int(match.group(1))
+        
+        return None
+    
+    def _strip_html(self, fragment: str) -> str:
+        """Convert a raw HTML fragment to plain text."""
+        return ' '.join(html_lib.unescape(self.HTML_TAG.sub(' ', fragment)).split())
+    
     def _extract_gita_verse_number(self, container) -> Optional[int]:
         """Extract verse number from Gita container."""
         # Look for verse number in various places
@@ -314,67 +464,58 @@ class HinduTextsScraper(BaseScraper):
         
         return None
     
-    def _extract_sanskrit_text(self, container) -> Optional[str]:
-        """Extract Sanskrit text from container."""
-        # Look for Sanskrit text in various elements
-        sanskrit_elem = container.find(['div', 'span', 'p'], class_=re.compile(r'sanskrit|devanagari'))
-        
-        if sanskrit_elem:
-            return sanskrit_elem.get_text(strip=True)
-        
-        # If no specific Sanskrit element, check if the main text is Sanskrit
-        main_text = container.get_text(strip=True)
-        if self._is_sanskrit_text(main_text):
-            return main_text
-        
-        return None
-    
-    def _extract_english_translation(self, container) -> Optional[str]:
-        """Extract English translation from container."""
-        # Look for translation elements
-        trans_elem = container.find(['div', 'span', 'p'], class_=re.compile(r'translation|english'))
+    def _extract_verse_parts(self, container) -> Dict[str, str]:
+        """Extract Sanskrit, translation and commentary text in a single traversal."""
+        parts: Dict[str, str] = {}
         
-        if trans_elem:
-            return trans_elem.get_text(strip=True)
+        # Walk the subtree once, claiming the first element that matches each part
+        for node in container.descendants:
+            if node.name not in self.VERSE_PART_TAGS:
+                continue
+            
+            classes = node.get('class') or ()
+            for part, pattern in self.VERSE_PART_PATTERNS:
+                if part not in parts and any(pattern.search(cls) for cls in classes):
+                    parts[part] = node.get_text(strip=True)
+            
+            if len(parts) == len(self.VERSE_PART_PATTERNS):
+                break
         
-        # If no specific translation element, get main text if it's English
-        main_text = container.get_text(strip=True)
-        if not self._is_sanskrit_text(main_text):
-            return main_text
+        # Without dedicated elements, fall back to the container text
+        if 'sanskrit' not in parts or 'english' not in parts:
+            self._apply_verse_text_fallback(parts, container.get_text(strip=True))
         
-        return None
+        return parts
     
-    def _extract_commentary(self, container) -> Optional[str]:
-        """Extract commentary from container."""
-        commentary_elem = container.find(['div', 'span', 'p'], class_=re.compile(r'commentary|purport|explanation'))
-        
-        if commentary_elem:
-            return commentary_elem.get_text(strip=True)
-        
-        return None
+    def _apply_verse_text_fallback(self, parts: Dict[str, str], main_text: str) -> None:
+        """Use the whole verse text for whichever of Sanskrit/English it is written in."""
+        if self._is_sanskrit_text(main_text):
+            parts.setdefault('sanskrit', main_text)
+        else:
+            parts.setdefault('english', main_text)
     
     def _is_sanskrit_text(self, text: str) -> bool:
         """Check if text is in Sanskrit (Devanagari script)."""
-        # Check for Devanagari Unicode range
-        devanagari_count = sum(1 for char in text if '\u0900' <= char <= '\u097F')
+        if not text:
+            return False
+        
+        # Count Devanagari characters by stripping them in one C-level pass
+        devanagari_count = len(text) - len(self.DEVANAGARI_PATTERN.sub('', text))
         
         # If more than 10% of characters are Devanagari, consider it Sanskrit
-        if len(text) > 0 and devanagari_count / len(text) > 0.1:
+        if devanagari_count / len(text) > 0.1:
             return True
         
         # Also check for common Sanskrit transliteration patterns
-        sanskrit_patterns = [
-            r'[aeiou]m\b',  # Common Sanskrit endings
-            r'[kg]h[aeiou]',  # Aspirated consonants
-            r'[td]h[aeiou]',
-            r'[pb]h[aeiou]',
-            r'[rl]i\b',
-            r'[aeiou]h\b'
-        ]
-        
-        pattern_matches = sum(1 for pattern in sanskrit_patterns if re.search(pattern, text.lower()))
+        lowered = text.lower()
+        pattern_matches = 0
+        for pattern in self.SANSKRIT_TRANSLITERATION_PATTERNS:
+            if pattern.search(lowered):
+                pattern_matches += 1
+                if pattern_matches >= 2:
+                    return True
         
-        return pattern_matches >= 2
+        return False
     
     async def scrape_specific_gita_verses(self, 
                                         chapter: int,
@@ -383,15 +524,11 @@ class HinduTextsScraper(BaseScraper):
                                         include_sanskrit: bool = True,
                                         include_commentary: bool = False) -> List[ScrapedText]:
         """Scrape specific verses from Bhagavad Gita."""
-        chapter_name = self.GITA_CHAPTERS.get(chapter, f"Chapter {chapter}")
-        
         if verse_end is None:
             verse_range = f"{verse_start}"
         else:
             verse_range = f"{verse_start}-{verse_end}"
         
-        url = f"{self.BHAGAVAD_GITA_BASE}/chapter/{chapter}/verse/{verse_start}"
-        
         try:
             # For now, scrape the whole chapter and filter
             chapter_texts = await self._scrape_gita_chapter(chapter, include_sanskrit)
@@ -409,3 +546,137 @@ class HinduTextsScraper(BaseScraper):
         except Exception as e:
             self.logger.error(f"Error scraping Gita verses {verse_range} from chapter {chapter}: {e}")
             return []
+
+
+class _GitaVerseTarget:
+    """lxml parser target collecting Gita verse parts as a chapter page streams in.
+    
+    Containers are chosen as in DOM mode: divs with a 'verse'/'sloka' class token,
+    or, only when the page has none, divs whose id mentions verse/sloka.
+    """
+    
+    def __init__(self, scraper: HinduTextsScraper):
+        self._by_class = _GitaVerseCollector(
+            scraper, lambda classes, attrib: 'verse' in classes or 'sloka' in classes
+        )
+        self._by_id = _GitaVerseCollector(
+            scraper, lambda classes, attrib: scraper.VERSE_CONTAINER_ID.search(attrib.get('id', ''))
+        )
+        self._collectors = (self._by_class, self._by_id)
+    
+    def start(self, tag: str, attrib) -> None:
+        for collector in self._collectors:
+            collector.start(tag, attrib)
+    
+    def data(self, data: str) -> None:
+        for collector in self._collectors:
+            collector.data(data)
+    
+    def end(self, tag: str) -> None:
+        for collector in self._collectors:
+            collector.end(tag)
+    
+    def close(self) -> List[Tuple[int, Dict[str, str]]]:
+        return self._by_class.verses or self._by_id.verses
+
+
+class _GitaVerseCollector:
+    """Collects verse numbers and parts from the containers one predicate selects."""
+    
+    def __init__(self, scraper: HinduTextsScraper, is_container):
+        self.scraper = scraper
+        self.is_container = is_container
+        self.verses: List[Tuple[int, Dict[str, str]]] = []
+        self._depth = 0  # Element depth inside the current verse container
+    
+    def start(self, tag: str, attrib) -> None:
+        classes = attrib.get('class', '').split()
+        
+        if self._depth == 0:
+            if tag == 'div' and self.is_container(classes, attrib):
+                self._depth = 1
+                self._attrib = dict(attrib)
+                self._pending: List[str] = []
+                self._text: List[str] = []
+                self._parts: Dict[str, List[str]] = {}
+                self._open_parts: Dict[str, int] = {}
+                self._number: Optional[List[str]] = None
+                self._number_depth: Optional[int] = None
+            return
+        
+        self._flush_text()
+        self._depth += 1
+        if tag not in self.scraper.VERSE_PART_TAGS:
+            return
+        
+        for part, pattern in self.scraper.VERSE_PART_PATTERNS:
+            if part not in self._parts and any(pattern.search(cls) for cls in classes):
+                self._parts[part] = []
+                self._open_parts[part] = self._depth
+        
+        if (self._number is None and tag != 'p'
+                and any(self.scraper.VERSE_NUMBER_CLASS.search(cls) for cls in classes)):
+            self._number = []
+            self._number_depth = self._depth
+    
+    def data(self, data: str) -> None:
+        # A text node may arrive in several pieces when it spans feed() chunks
+        if self._depth:
+            self._pending.append(data)
+    
+    def _flush_text(self) -> None:
+        """Distribute the buffered text node to the container and any open parts."""
+        text = ''.join(self._pending).strip()
+        self._pending.clear()
+        if not text:
+            return
+        
+        self._text.append(text)
+        for part in self._open_parts:
+            self._parts[part].append(text)
+        if self._number_depth is not None:
+            self._number.append(text)
+    
+    def end(self, tag: str) -> None:
+        if self._depth == 0:
+            return
+        
+        self._flush_text()
+        for part, depth in list(self._open_parts.items()):
+            if depth == self._depth:
+                del self._open_parts[part]
+        if self._number_depth == self._depth:
+            self._number_depth = None
+        
+        self._depth -= 1
+        if self._depth == 0:
+            self._finish_verse()
+    
+    def _finish_verse(self) -> None:
+        """Resolve the verse number and parts of the container that just closed."""
+        verse_num = None
+        
+        if self._number:
+            match = re.search(r'(\d+)', ''.join(self._number))
+            if match:
+                verse_num = int(match.group(1))
+        
+        if verse_num is None and self._attrib.get('data-verse'):
+            try:
+                verse_num = int(self._attrib['data-verse'])
+            except ValueError:
+                pass
+        
+        if verse_num is None and self._attrib.get('id'):
+            match = re.search(r'verse.*?(\d+)', self._attrib['id'])
+            if match:
+                verse_num = int(match.group(1))
+        
+        if not verse_num:
+            return
+        
+        parts = {part: ''.join(text) for part, text in self._parts.items()}
+        if 'sanskrit' not in parts or 'english' not in parts:
+            self.scraper._apply_verse_text_fallback(parts, ''.join(self._text))
+        
+        self.verses.append((verse_num, parts))
@@ -2,9 +2,13 @@
 
 import asyncio
 import re
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable, Sequence
 from urllib.parse import urljoin
 
+import httpx
+import lxml.html
+from lxml import etree
+
 from .base_scraper import BaseScraper, ScrapedText
 from ..database.models import TextType, Language
 
@@ -15,38 +19,68 @@ class QuranScraper(BaseScraper):
     QURAN_COM_BASE = "https://quran.com"
     TANZIL_BASE = "https://tanzil.net"
     
-    # Surah names mapping
-    SURAH_NAMES = {
-        1: "Al-Fatiha", 2: "Al-Baqarah", 3: "Ali 'Imran", 4: "An-Nisa",
-        5: "Al-Ma'idah", 6: "Al-An'am", 7: "Al-A'raf", 8: "Al-Anfal",
-        9: "At-Tawbah", 10: "Yunus", 11: "Hud", 12: "Yusuf",
-        13: "Ar-Ra'd", 14: "Ibrahim", 15: "Al-Hijr", 16: "An-Nahl",
-        17: "Al-Isra", 18: "Al-Kahf", 19: "Maryam", 20: "Ta-Ha",
-        21: "Al-Anbya", 22: "Al-Hajj", 23: "Al-Mu'minun", 24: "An-Nur",
-        25: "Al-Furqan", 26: "Ash-Shu'ara", 27: "An-Naml", 28: "Al-Qasas",
-        29: "Al-'Ankabut", 30: "Ar-Rum", 31: "Luqman", 32: "As-Sajdah",
-        33: "Al-Ahzab", 34: "Saba", 35: "Fatir", 36: "Ya-Sin",
-        37: "As-Saffat", 38: "Sad", 39: "Az-Zumar", 40: "Ghafir",
-        41: "Fussilat", 42: "Ash-Shuraa", 43: "Az-Zukhruf", 44: "Ad-Dukhan",
-        45: "Al-Jathiyah", 46: "Al-Ahqaf", 47: "Muhammad", 48: "Al-Fath",
-        49: "Al-Hujurat", 50: "Qaf", 51: "Adh-Dhariyat", 52: "At-Tur",
-        53: "An-Najm", 54: "Al-Qamar", 55: "Ar-Rahman", 56: "Al-Waqi'ah",
-        57: "Al-Hadid", 58: "Al-Mujadila", 59: "Al-Hashr", 60: "Al-Mumtahanah",
-        61: "As-Saff", 62: "Al-Jumu'ah", 63: "Al-Munafiqun", 64: "At-Taghabun",
-        65: "At-Talaq", 66: "At-Tahrim", 67: "Al-Mulk", 68: "Al-Qalam",
-        69: "Al-Haqqah", 70: "Al-Ma'arij", 71: "Nuh", 72: "Al-Jinn",
-        73: "Al-Muzzammil", 74: "Al-Muddaththir", 75: "Al-Qiyamah", 76: "Al-Insan",
-        77: "Al-Mursalat", 78: "An-Naba", 79: "An-Nazi'at", 80: "'Abasa",
-        81: "At-Takwir", 82: "Al-Infitar", 83: "Al-Mutaffifin", 84: "Al-Inshiqaq",
-        85: "Al-Buruj", 86: "At-Tariq", 87: "Al-A'la", 88: "Al-Ghashiyah",
-        89: "Al-Fajr", 90: "Al-Balad", 91: "Ash-Shams", 92: "Al-Layl",
-        93: "Ad-Duhaa", 94: "Ash-Sharh", 95: "At-Tin", 96: "Al-'Alaq",
-        97: "Al-Qadr", 98: "Al-Bayyinah", 99: "Az-Zalzalah", 100: "Al-'Adiyat",
-        101: "Al-Qari'ah", 102: "At-Takathur", 103: "Al-'Asr", 104: "Al-Humazah",
-        105: "Al-Fil", 106: "Quraysh", 107: "Al-Ma'un", 108: "Al-Kawthar",
-        109: "Al-Kafirun", 110: "An-Nasr", 111: "Al-Masad", 112: "Al-Ikhlas",
-        113: "Al-Falaq", 114: "An-Nas"
-    }
+    # Failures that skip a page rather than abort the scrape
+    SCRAPE_ERRORS = (httpx.HTTPError, etree.LxmlError, ValueError)
+    
+    # Compiled XPath selectors for Quran.com pages
+    VERSE_CONTAINERS_XPATH = etree.XPath(
+        "//div[contains(concat(' ', normalize-space(@class), ' '), ' verse-container ')]"
+    )
+    VERSE_NUMBER_XPATH = etree.XPath(
+        "(.//span[contains(concat(' ', normalize-space(@class), ' '), ' verse-number ')])[1]"
+    )
+    ARABIC_TEXT_XPATH = etree.XPath(
+        "(.//div[contains(concat(' ', normalize-space(@class), ' '), ' arabic-text ')])[1]"
+    )
+    CONTAINER_TRANSLATIONS_XPATH = etree.XPath(
+        ".//div[contains(concat(' ', normalize-space(@class), ' '), ' translation ')]"
+    )
+    
+    # Surah names indexed by surah number (index 0 is unused)
+    SURAH_NAMES = (
+        None,
+        "Al-Fatiha", "Al-Baqarah", "Ali 'Imran", "An-Nisa",
+        "Al-Ma'idah", "Al-An'am", "Al-A'raf", "Al-Anfal",
+        "At-Tawbah", "Yunus", "Hud", "Yusuf",
+        "Ar-Ra'd", "Ibrahim", "Al-Hijr", "An-Nahl",
+        "Al-Isra", "Al-Kahf", "Maryam", "Ta-Ha",
+        "Al-Anbya", "Al-Hajj", "Al-Mu'minun", "An-Nur",
+        "Al-Furqan", "Ash-Shu'ara", "An-Naml", "Al-Qasas",
+        "Al-'Ankabut", "Ar-Rum", "Luqman", "As-Sajdah",
+        "Al-Ahzab", "Saba", "Fatir", "Ya-Sin",
+        "As-Saffat", "Sad", "Az-Zumar", "Ghafir",
+        "Fussilat", "Ash-Shuraa", "Az-Zukhruf", "Ad-Dukhan",
+        "Al-Jathiyah", "Al-Ahqaf", "Muhammad", "Al-Fath",
+        "Al-Hujurat", "Qaf", "Adh-Dhariyat", "At-Tur",
+        "An-Najm", "Al-Qamar", "Ar-Rahman", "Al-Waqi'ah",
+        "Al-Hadid", "Al-Mujadila", "Al-Hashr", "Al-Mumtahanah",
+        "As-Saff", "Al-Jumu'ah", "Al-Munafiqun", "At-Taghabun",
+        "At-Talaq", "At-Tahrim", "Al-Mulk", "Al-Qalam",
+        "Al-Haqqah", "Al-Ma'arij", "Nuh", "Al-Jinn",
+        "Al-Muzzammil", "Al-Muddaththir", "Al-Qiyamah", "Al-Insan",
+        "Al-Mursalat", "An-Naba", "An-Nazi'at", "'Abasa",
+        "At-Takwir", "Al-Infitar", "Al-Mutaffifin", "Al-Inshiqaq",
+        "Al-Buruj", "At-Tariq", "Al-A'la", "Al-Ghashiyah",
+        "Al-Fajr", "Al-Balad", "Ash-Shams", "Al-Layl",
+        "Ad-Duhaa", "Ash-Sharh", "At-Tin", "Al-'Alaq",
+        "Al-Qadr", "Al-Bayyinah", "Az-Zalzalah", "Al-'Adiyat",
+        "Al-Qari'ah", "At-Takathur", "Al-'Asr", "Al-Humazah",
+        "Al-Fil", "Quraysh", "Al-Ma'un", "Al-Kawthar",
+        "Al-Kafirun", "An-Nasr", "Al-Masad", "Al-Ikhlas",
+        "Al-Falaq", "An-Nas"
+    )
+    
+    def __init__(self, *args, surah_concurrency: int = 8, **kwargs):
+        super().__init__(*args, **kwargs)
+        
+        # Max surahs scraped concurrently
+        self._surah_semaphore = asyncio.Semaphore(surah_concurrency)
+    
+    def _surah_name(self, surah: int) -> str:
+        """Get the name of a surah by number."""
+        if 1 <= surah < len(self.SURAH_NAMES):
+            return self.SURAH_NAMES[surah]
+        return f"Surah {surah}"
     
     def get_supported_text_types(self) -> List[TextType]:
         """Get supported text types."""
@@ -65,35 +99,43 @@ class QuranScraper(BaseScraper):
         if translations is None:
             translations = ["en.sahih", "en.pickthall", "en.yusufali"]
         
+        if source not in ("quran_com", "tanzil"):
+            self.logger.warning("Unknown source: %s", source)
+            return []
+        
+        # Fan out across surahs; the semaphore bounds how many run at once
+        results = await asyncio.gather(
+            *(self._scrape_surah(surah, translations, include_arabic, source) for surah in surahs),
+            return_exceptions=True
+        )
+        
         scraped_texts = []
         
-        for surah in surahs:
-            try:
-                if source == "quran_com":
-                    texts = await self._scrape_from_quran_com(surah, translations, include_arabic)
-                elif source == "tanzil":
-                    texts = await self._scrape_from_tanzil(surah, translations, include_arabic)
-                else:
-                    self.logger.warning(f"Unknown source: {source}")
-                    continue
-                
-                scraped_texts.extend(texts)
-                
-                # Add delay to be respectful
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                self.logger.error(f"Error scraping Surah {surah}: {e}")
+        for surah, result in zip(surahs, results):
+            if isinstance(result, Exception):
+                self.logger.error("Error scraping Surah %s: %s", surah, result)
                 continue
+            scraped_texts.extend(result)
         
         return scraped_texts
     
+    async def _scrape_surah(self,
+                          surah: int,
+                          translations: List[str],
+                          include_arabic: bool,
+                          source: str) -> List[ScrapedText]:
+        """Scrape a single surah from the selected source."""
+        async with self._surah_semaphore:
+            if source == "quran_com":
+                return await self._scrape_from_quran_com(surah, translations, include_arabic)
+            return await self._scrape_from_tanzil(surah, translations, include_arabic)
+    
     async def _scrape_from_quran_com(self, 
                                    surah: int, 
                                    translations: List[str],
                                    include_arabic: bool) -> List[ScrapedText]:
         """Scrape from Quran.com."""
-        surah_name = self.SURAH_NAMES.get(surah, f"Surah {surah}")
+        surah_name = self._surah_name(surah)
         
         texts = []
         
@@ -103,18 +145,12 @@ class QuranScraper(BaseScraper):
             texts.extend(arabic_texts)
         
         # Scrape translations
+        # (each fetch logs and skips its own network/parse failures)
         for translation in translations:
-            try:
-                translation_texts = await self._scrape_translation_from_quran_com(
-                    surah, translation
-                )
-                texts.extend(translation_texts)
-                
-                await asyncio.sleep(0.5)  # Small delay between translations
-                
-            except Exception as e:
-                self.logger.error(f"Error scraping translation {translation} for Surah {surah}: {e}")
-                continue
+            translation_texts = await self._scrape_translation_from_quran_com(
+                surah, translation
+            )
+            texts.extend(translation_texts)
         
         return texts
     
@@ -124,51 +160,10 @@ class QuranScraper(BaseScraper):
         
         try:
             html = await self.fetch_page(url)
-            soup = self.parse_html(html)
+            return self._extract_verses(lxml.html.fromstring(html), surah, url)
             
-            texts = []
-            surah_name = self.SURAH_NAMES.get(surah, f"Surah {surah}")
-            
-            # Find verse containers
-            verse_containers = soup.find_all('div', class_='verse-container')
-            
-            for container in verse_containers:
-                # Extract verse number
-                verse_num_elem = container.find('span', class_='verse-number')
-                if not verse_num_elem:
-                    continue
-                
-                try:
-                    verse_num = int(verse_num_elem.get_text(strip=True))
-                except ValueError:
-                    continue
-                
-                # Extract Arabic text
-                arabic_elem = container.find('div', class_='arabic-text')
-                if arabic_elem:
-                    arabic_text = arabic_elem.get_text(strip=True)
-                    
-                    texts.append(ScrapedText(
-                        title=f"{surah_name} {surah}:{verse_num}",
-                        content=self.clean_text(arabic_text),
-                        text_type=TextType.QURAN,
-                        language=Language.ARABIC,
-                        book=surah_name,
-                        chapter=surah,
-                        verse=verse_num,
-                        source_url=url,
-                        metadata={
-                            'surah_number': surah,
-                            'surah_name': surah_name,
-                            'source': 'Quran.com',
-                            'text_type': 'original_arabic'
-                        }
-                    ))
-            
-            return texts
-            
-        except Exception as e:
-            self.logger.error(f"Error scraping Arabic from Quran.com Surah {surah}: {e}")
+        except self.SCRAPE_ERRORS as e:
+            self.logger.error("Error scraping Arabic from Quran.com Surah %s: %s", surah, e)
             return []
     
     async def _scrape_translation_from_quran_com(self, 
@@ -179,56 +174,158 @@ class QuranScraper(BaseScraper):
         
         try:
             html = await self.fetch_page(url)
-            soup = self.parse_html(html)
+            return self._extract_verses(
+                lxml.html.fromstring(html), surah, url,
+                include_arabic=False,
+                translation=translation
+            )
             
-            texts = []
-            surah_name = self.SURAH_NAMES.get(surah, f"Surah {surah}")
-            
-            # Find translation containers
-            translation_containers = soup.find_all('div', class_='translation')
+        except self.SCRAPE_ERRORS as e:
+            self.logger.error("Error scraping translation %s from Quran.com Surah %s: %s", translation, surah, e)
+            return []
+    
+    def _extract_verses(self,
+                        tree,
+                        surah: int,
+                        url: str,
+                        include_arabic: bool = True,
+                        translation: Optional[str] = None,
+                        translations: Sequence[str] = (),
+                        verse_filter: Optional[Callable[[int], bool]] = None,
+                        extra_metadata: Optional[Dict[str, Any]] = None) -> List[ScrapedText]:
+        """Extract Arabic and translation texts from a parsed Quran.com page.
+        
+        ``translation`` names the single translation the page was requested with;
+        otherwise every translation block is extracted and identified against
+        ``translations``.
+        """
+        surah_name = self._surah_name(surah)
+        include_translations = bool(translation or translations)
+        
+        # One alternation over the requested ids, longest first so prefixes don't shadow them
+        translation_pattern = None
+        if translations and not translation:
+            translation_pattern = re.compile(
+                '|'.join(map(re.escape, sorted(translations, key=len, reverse=True)))
+            )
+        
+        # Fields shared by every verse of the surah
+        title_prefix = f"{surah_name} {surah}:"
+        base_metadata = {
+            'surah_number': surah,
+            'surah_name': surah_name,
+            'source': 'Quran.com',
+            **(extra_metadata or {})
+        }
+        arabic_metadata = {**base_metadata, 'text_type': 'original_arabic'}
+        
+        # Resolve verse numbers once, keeping only the requested verses
+        verses = [
+            (verse_num, container)
+            for container in self.VERSE_CONTAINERS_XPATH(tree)
+            if (verse_num := self._extract_verse_number(container)) is not None
+            and (verse_filter is None or verse_filter(verse_num))
+        ]
+        
+        # Arabic-only pages (the full-surah case) are built in a single comprehension
+        if not include_translations:
+            if not include_arabic:
+                return []
+            return [
+                arabic_text
+                for verse_num, container in verses
+                if (arabic_text := self._arabic_verse_text(
+                    container, verse_num, surah, surah_name, title_prefix, url, arabic_metadata
+                ))
+            ]
+        
+        texts = []
+        
+        for verse_num, container in verses:
+            # Extract Arabic text
+            if include_arabic:
+                arabic_text = self._arabic_verse_text(
+                    container, verse_num, surah, surah_name, title_prefix, url, arabic_metadata
+                )
+                if arabic_text:
+                    texts.append(arabic_text)
             
-            for container in translation_containers:
-                # Extract verse number from parent or sibling
-                verse_container = container.find_parent('div', class_='verse-container')
-                if not verse_container:
-                    continue
-                
-                verse_num_elem = verse_container.find('span', class_='verse-number')
-                if not verse_num_elem:
-                    continue
-                
-                try:
-                    verse_num = int(verse_num_elem.get_text(strip=True))
-                except ValueError:
+            # Extract translations
+            for trans_container in self.CONTAINER_TRANSLATIONS_XPATH(container):
+                translation_text = self._element_text(trans_container)
+                if not translation_text:
                     continue
                 
-                # Extract translation text
-                translation_text = container.get_text(strip=True)
+                if translation_pattern:
+                    translation_id = self._identify_translation(trans_container, translation_pattern)
+                else:
+                    translation_id = translation or "unknown"
                 
-                if translation_text:
-                    texts.append(ScrapedText(
-                        title=f"{surah_name} {surah}:{verse_num} ({translation})",
-                        content=self.clean_text(translation_text),
-                        text_type=TextType.QURAN,
-                        language=Language.ENGLISH,
-                        book=surah_name,
-                        chapter=surah,
-                        verse=verse_num,
-                        translator=translation,
-                        source_url=url,
-                        metadata={
-                            'surah_number': surah,
-                            'surah_name': surah_name,
-                            'translation': translation,
-                            'source': 'Quran.com'
-                        }
-                    ))
-            
-            return texts
-            
-        except Exception as e:
-            self.logger.error(f"Error scraping translation {translation} from Quran.com Surah {surah}: {e}")
-            return []
+                texts.append(ScrapedText(
+                    title=f"{title_prefix}{verse_num} ({translation_id})",
+                    content=self.clean_text(translation_text),
+                    text_type=TextType.QURAN,
+                    language=Language.ENGLISH,
+                    book=surah_name,
+                    chapter=surah,
+                    verse=verse_num,
+                    translator=translation_id,
+                    source_url=url,
+                    metadata={**base_metadata, 'translation': translation_id}
+                ))
+        
+        return texts
+    
+    def _arabic_verse_text(self,
+                           container,
+                           verse_num: int,
+                           surah: int,
+                           surah_name: str,
+                           title_prefix: str,
+                           url: str,
+                           arabic_metadata: Dict[str, Any]) -> Optional[ScrapedText]:
+        """Build the Arabic text of a Quran.com verse container, if it has one."""
+        arabic_elems = self.ARABIC_TEXT_XPATH(container)
+        if not arabic_elems:
+            return None
+        
+        return ScrapedText(
+            title=title_prefix + str(verse_num),
+            content=self.clean_text(self._element_text(arabic_elems[0])),
+            text_type=TextType.QURAN,
+            language=Language.ARABIC,
+            book=surah_name,
+            chapter=surah,
+            verse=verse_num,
+            source_url=url,
+            metadata=dict(arabic_metadata)
+        )
+    
+    def _identify_translation(self, trans_container, translation_pattern: re.Pattern) -> str:
+        """Identify which of the requested translations a translation block holds."""
+        # The id normally sits in the block's own attributes, which avoids serializing it
+        for value in trans_container.attrib.values():
+            match = translation_pattern.search(value)
+            if match:
+                return match.group()
+        
+        match = translation_pattern.search(etree.tostring(trans_container, encoding='unicode'))
+        return match.group() if match else "unknown"
+    
+    def _extract_verse_number(self, container) -> Optional[int]:
+        """Extract the verse number from a Quran.com verse container element."""
+        verse_num_elems = self.VERSE_NUMBER_XPATH(container)
+        if not verse_num_elems:
+            return None
+        
+        try:
+            return int(self._element_text(verse_num_elems[0]))
+        except ValueError:
+            return None
+    
+    def _element_text(self, element) -> str:
+        """Get the stripped text of an lxml element and its descendants."""
+        return ''.join(text.strip() for text in element.itertext())
     
     async def _scrape_from_tanzil(self, 
                                 surah: int, 
@@ -237,47 +334,77 @@ class QuranScraper(BaseScraper):
         """Scrape from Tanzil.net."""
         # Tanzil has a different API structure
         texts = []
-        surah_name = self.SURAH_NAMES.get(surah, f"Surah {surah}")
+        surah_name = self._surah_name(surah)
         
         # Scrape Arabic if requested
         if include_arabic:
             url = f"{self.TANZIL_BASE}/quran/{surah}"
             
             try:
-                html = await self.fetch_page(url)
-                soup = self.parse_html(html)
+                # Fields shared by every verse of the surah
+                title_prefix = f"{surah_name} {surah}:"
+                base_metadata = {
+                    'surah_number': surah,
+                    'surah_name': surah_name,
+                    'source': 'Tanzil.net',
+                    'text_type': 'original_arabic'
+                }
                 
-                # Find verse elements
-                verse_elements = soup.find_all('span', class_='verse')
+                # Parse verse elements incrementally as the page streams in
+                parser = etree.HTMLPullParser(events=('end',), tag='span')
                 
-                for verse_elem in verse_elements:
-                    verse_num_attr = verse_elem.get('data-verse')
-                    if verse_num_attr:
-                        try:
-                            verse_num = int(verse_num_attr)
-                            verse_text = verse_elem.get_text(strip=True)
-                            
-                            texts.append(ScrapedText(
-                                title=f"{surah_name} {surah}:{verse_num}",
-                                content=self.clean_text(verse_text),
-                                text_type=TextType.QURAN,
-                                language=Language.ARABIC,
-                                book=surah_name,
-                                chapter=surah,
-                                verse=verse_num,
-                                source_url=url,
-                                metadata={
-                                    'surah_number': surah,
-                                    'surah_name': surah_name,
-                                    'source': 'Tanzil.net',
-                                    'text_type': 'original_arabic'
-                                }
-                            ))
-                        except ValueError:
-                            continue
+                async for chunk in self.stream_page(url):
+                    parser.feed(chunk)
+                    texts.extend(self._drain_tanzil_verses(parser, surah, surah_name, title_prefix, base_metadata, url))
                 
-            except Exception as e:
-                self.logger.error(f"Error scraping Arabic from Tanzil Surah {surah}: {e}")
+                parser.close()
+                texts.extend(self._drain_tanzil_verses(parser, surah, surah_name, title_prefix, base_metadata, url))
+                
+            except self.SCRAPE_ERRORS as e:
+                self.logger.error("Error scraping Arabic from Tanzil Surah %s: %s", surah, e)
+        
+        return texts
+    
+    def _drain_tanzil_verses(self,
+                             parser,
+                             surah: int,
+                             surah_name: str,
+                             title_prefix: str,
+                             base_metadata: Dict[str, Any],
+                             url: str) -> List[ScrapedText]:
+        """Build texts for the Tanzil verse elements completed so far, freeing them as we go."""
+        texts = []
+        
+        for _, verse_elem in parser.read_events():
+            if 'verse' not in verse_elem.get('class', '').split():
+                continue
+            
+            verse_num_attr = verse_elem.get('data-verse')
+            if verse_num_attr:
+                try:
+                    verse_num = int(verse_num_attr)
+                except ValueError:
+                    verse_num = None
+                
+                if verse_num is not None:
+                    texts.append(ScrapedText(
+                        title=title_prefix + str(verse_num),
+                        content=self.clean_text(self._element_text(verse_elem)),
+                        text_type=TextType.QURAN,
+                        language=Language.ARABIC,
+                        book=surah_name,
+                        chapter=surah,
+                        verse=verse_num,
+                        source_url=url,
+                        metadata=dict(base_metadata)
+                    ))
+            
+            # Drop the finished verse and any earlier siblings to keep the tree small
+            verse_elem.clear(keep_tail=True)
+            parent = verse_elem.getparent()
+            if parent is not None:
+                while verse_elem.getprevious() is not None:
+                    del parent[0]
         
         return texts
     
@@ -291,8 +418,6 @@ class QuranScraper(BaseScraper):
         if translations is None:
             translations = ["en.sahih"]
         
-        surah_name = self.SURAH_NAMES.get(surah, f"Surah {surah}")
-        
         if verse_end is None:
             verse_range = f"{verse_start}"
         else:
@@ -300,90 +425,18 @@ class QuranScraper(BaseScraper):
         
         url = f"{self.QURAN_COM_BASE}/{surah}:{verse_range}"
         
-        texts = []
-        
         try:
             html = await self.fetch_page(url)
-            soup = self.parse_html(html)
-            
-            # Process similar to full surah scraping but for specific verses
-            verse_containers = soup.find_all('div', class_='verse-container')
-            
-            for container in verse_containers:
-                verse_num_elem = container.find('span', class_='verse-number')
-                if not verse_num_elem:
-                    continue
-                
-                try:
-                    verse_num = int(verse_num_elem.get_text(strip=True))
-                    
-                    # Check if verse is in requested range
-                    if verse_num < verse_start:
-                        continue
-                    if verse_end and verse_num > verse_end:
-                        continue
-                    
-                except ValueError:
-                    continue
-                
-                # Extract Arabic if requested
-                if include_arabic:
-                    arabic_elem = container.find('div', class_='arabic-text')
-                    if arabic_elem:
-                        arabic_text = arabic_elem.get_text(strip=True)
-                        
-                        texts.append(ScrapedText(
-                            title=f"{surah_name} {surah}:{verse_num}",
-                            content=self.clean_text(arabic_text),
-                            text_type=TextType.QURAN,
-                            language=Language.ARABIC,
-                            book=surah_name,
-                            chapter=surah,
-                            verse=verse_num,
-                            source_url=url,
-                            metadata={
-                                'surah_number': surah,
-                                'surah_name': surah_name,
-                                'source': 'Quran.com',
-                                'text_type': 'original_arabic',
-                                'verse_range': verse_range
-                            }
-                        ))
-                
-                # Extract translations
-                translation_containers = container.find_all('div', class_='translation')
-                for trans_container in translation_containers:
-                    translation_text = trans_container.get_text(strip=True)
-                    
-                    if translation_text:
-                        # Try to identify which translation this is
-                        translation_id = "unknown"
-                        for trans in translations:
-                            if trans in str(trans_container):
-                                translation_id = trans
-                                break
-                        
-                        texts.append(ScrapedText(
-                            title=f"{surah_name} {surah}:{verse_num} ({translation_id})",
-                            content=self.clean_text(translation_text),
-                            text_type=TextType.QURAN,
-                            language=Language.ENGLISH,
-                            book=surah_name,
-                            chapter=surah,
-                            verse=verse_num,
-                            translator=translation_id,
-                            source_url=url,
-                            metadata={
-                                'surah_number': surah,
-                                'surah_name': surah_name,
-                                'translation': translation_id,
-                                'source': 'Quran.com',
-                                'verse_range': verse_range
-                            }
-                        ))
             
-            return texts
+            # Process like full surah scraping, keeping only the requested verses
+            return self._extract_verses(
+                lxml.html.fromstring(html), surah, url,
+                include_arabic=include_arabic,
+                translations=translations,
+                verse_filter=lambda verse_num: verse_num >= verse_start and (not verse_end or verse_num <= verse_end),
+                extra_metadata={'verse_range': verse_range}
+            )
             
-        except Exception as e:
-            self.logger.error(f"Error scraping verses {verse_range} from Surah {surah}: {e}")
+        except self.SCRAPE_ERRORS as e:
+            self.logger.error("Error scraping verses %s from Surah %s: %s", verse_range, surah, e)
             return []
@@ -10,7 +10,7 @@ import uuid
 from .scraper_factory import ScraperFactory
 from .text_processor import TextProcessor, ProcessedText
 from .base_scraper import ScrapedText
-from yggdrasil.database.models import TextType, SpiritualText, FieldCategory, SubfieldCategory
+from yggdrasil.database.models import TextType, YggdrasilText, FieldCategory, SubfieldCategory
 from ..database.connection import db_manager, get_qdrant
 from ..database.qdrant_manager import qdrant_manager
 from sqlalchemy import select
@@ -51,6 +51,7 @@ class HybridScrapingManager:
         
         # Scrape texts for each type
         for text_type in text_types:
+            scraper = None
             try:
                 self.logger.info(f"Starting hybrid scraping for {text_type.value}")
                 
@@ -75,6 +76,9 @@ class HybridScrapingManager:
                 error_msg = f"Error scraping {text_type.value}: {str(e)}"
                 self.logger.error(error_msg)
                 results['errors'].append(error_msg)
+            finally:
+                if scraper:
+                    await scraper.aclose()
         
         # Process and store in hybrid database
         if all_scraped_texts:
@@ -168,8 +172,8 @@ class HybridScrapingManager:
                         session, scraped_text.text_type
                     )
                     
-                    # Create SpiritualText object
-                    spiritual_text = SpiritualText(
+                    # Create YggdrasilText object
+                    spiritual_text = YggdrasilText(
                         id=text_id,
                         title=processed_text.title,
                         text_type=scraped_text.text_type,
@@ -10,6 +10,22 @@ from .base_scraper import ScrapedText
 from ..database.models import TextType, Language
 
 
+# Deep-cleaning patterns, compiled once at import
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+WEB_ARTIFACT_PATTERN = re.compile(r'(?:Next|Previous|Index|Contents|Home)(?:\s*\||\s*$)', re.IGNORECASE)
+STANDALONE_NUMBER_PATTERN = re.compile(r'^\d+\s*$', re.MULTILINE)
+COPYRIGHT_PATTERN = re.compile(r'©.*?(?:\d{4}|\n)', re.IGNORECASE)
+URL_PATTERN = re.compile(r'https?://\S+')
+EMAIL_PATTERN = re.compile(r'\S+@\S+\.\S+')
+ELLIPSIS_PATTERN = re.compile(r'[.]{3,}')
+EXCLAMATION_PATTERN = re.compile(r'[!]{2,}')
+QUESTION_PATTERN = re.compile(r'[?]{2,}')
+SPACE_BEFORE_PUNCTUATION_PATTERN = re.compile(r'\s+([,.!?;:])')
+SENTENCE_SPACING_PATTERN = re.compile(r'([.!?])\s*([A-Z])')
+DASH_TRANSLATION = str.maketrans({'–': '-', '—': '-'})
+
+
 @dataclass
 class ProcessedText:
     """Processed spiritual text with enhanced metadata."""
@@ -128,39 +144,37 @@ class TextProcessor:
             return ""
         
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = HTML_TAG_PATTERN.sub('', text)
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_PATTERN.sub(' ', text)
         
         # Remove common web artifacts
-        text = re.sub(r'(?:Next|Previous|Index|Contents|Home)(?:\s*\||\s*$)', '', text, flags=re.IGNORECASE)
+        text = WEB_ARTIFACT_PATTERN.sub('', text)
         
         # Remove verse numbers that are standalone
-        text = re.sub(r'^\d+\s*$', '', text, flags=re.MULTILINE)
+        text = STANDALONE_NUMBER_PATTERN.sub('', text)
         
         # Remove copyright notices
-        text = re.sub(r'©.*?(?:\d{4}|\n)', '', text, flags=re.IGNORECASE)
+        text = COPYRIGHT_PATTERN.sub('', text)
         
         # Remove URLs
-        text = re.sub(r'https?://\S+', '', text)
+        text = URL_PATTERN.sub('', text)
         
         # Remove email addresses
-        text = re.sub(r'\S+@\S+\.\S+', '', text)
+        text = EMAIL_PATTERN.sub('', text)
         
-        # Normalize punctuation
-        text = re.sub(r'["""]', '"', text)
-        text = re.sub(r"[''']", "'", text)
-        text = re.sub(r'[–—]', '-', text)
+        # Normalize dashes
+        text = text.translate(DASH_TRANSLATION)
         
         # Remove excessive punctuation
-        text = re.sub(r'[.]{3,}', '...', text)
-        text = re.sub(r'[!]{2,}', '!', text)
-        text = re.sub(r'[?]{2,}', '?', text)
+        text = ELLIPSIS_PATTERN.sub('...', text)
+        text = EXCLAMATION_PATTERN.sub('!', text)
+        text = QUESTION_PATTERN.sub('?', text)
         
         # Clean up spacing around punctuation
-        text = re.sub(r'\s+([,.!?;:])', r'\1', text)
-        text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)
+        text = SPACE_BEFORE_PUNCTUATION_PATTERN.sub(r'\1', text)
+        text = SENTENCE_SPACING_PATTERN.sub(r'\1 \2', text)
         
         return text.strip()
     
@@ -2,15 +2,26 @@
 
 import asyncio
 import logging
+import re
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlparse
 
 from .book_scraper import BookScraper, CompleteBook
 from .academic_scraper import AcademicScraper, AcademicPaper
 from .scraping_manager import HybridScrapingManager
 from ..database.enhanced_models import YggdrasilText, KnowledgeCategory, ContentType, KnowledgeDomain
 
+# Category name and description for each knowledge domain
+_DOMAIN_TITLE = {domain: domain.value.title() for domain in KnowledgeDomain}
+_DOMAIN_DESC = {domain: f"Content related to {domain.value}" for domain in KnowledgeDomain}
+
+# Chunk boundaries: the last whitespace in a window, and the first one after it
+_LAST_WHITESPACE = re.compile(r'.*\s', re.DOTALL)
+_WHITESPACE = re.compile(r'\s')
+
+
 class YggdrasilScrapingManager(HybridScrapingManager):
     """Enhanced scraping manager for the Yggdrasil knowledge system."""
     
@@ -19,11 +30,29 @@ class YggdrasilScrapingManager(HybridScrapingManager):
         self.book_scraper = None
         self.academic_scraper = None
         
+        # Category ids resolved so far, keyed by domain
+        self._category_ids: Dict[KnowledgeDomain, Any] = {}
+        
     async def initialize(self):
         """Initialize enhanced scrapers."""
         await super().initialize()
         self.book_scraper = BookScraper(self.db_manager)
         self.academic_scraper = AcademicScraper(self.db_manager)
+    
+    async def shutdown(self):
+        """Close the HTTP clients held by the enhanced scrapers."""
+        for scraper in (self.book_scraper, self.academic_scraper):
+            if scraper:
+                await scraper.aclose()
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.initialize()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.shutdown()
         
     async def import_complete_book(self, 
                                 source: str, 
@@ -119,7 +148,10 @@ class YggdrasilScrapingManager(HybridScrapingManager):
         
         try:
             # Find or create category
-            category = await self._get_or_create_category(book.domain, session)
+            category_id = await self._get_category_id(book.domain, session)
+            
+            full_content = book.full_content or ""
+            total_words = len(full_content.split())
             
             # Create main book entry
             main_text = YggdrasilText(
@@ -127,7 +159,7 @@ class YggdrasilScrapingManager(HybridScrapingManager):
                 content_type=book.content_type,
                 domain=book.domain,
                 language=book.language,
-                content=book.full_content[:chunk_size] if len(book.full_content) > chunk_size else book.full_content,
+                content=full_content[:chunk_size],
                 author=book.author,
                 isbn=book.isbn,
                 publisher=book.publisher,
@@ -136,62 +168,63 @@ class YggdrasilScrapingManager(HybridScrapingManager):
                 is_full_book=True,
                 total_pages=book.total_pages,
                 chapter_count=len(book.chapters) if book.chapters else None,
-                category_id=category.id,
-                word_count=len(book.full_content.split()) if book.full_content else 0,
+                category_id=category_id,
+                word_count=total_words,
                 scraped_at=datetime.utcnow(),
                 metadata={
                     "import_type": "complete_book",
-                    "source_format": Path(book.source_url).suffix if book.source_url else None
+                    "source_format": self._source_format(book.source_url) if book.source_url else None
                 }
             )
             
             session.add(main_text)
-            await session.commit()
+            # Flush (not commit) so main_text.id is assigned for the child rows
+            await session.flush()
+            
+            pending = []
             
-            chunks_created = 0
+            # Columns shared by every chunk and chapter row, resolved once
+            title_prefix = f"{book.title} - "
+            child_fields = {
+                "content_type": book.content_type,
+                "domain": book.domain,
+                "language": book.language,
+                "author": book.author,
+                "source_url": book.source_url,
+                "parent_text_id": main_text.id,
+                "category_id": category_id,
+                "scraped_at": main_text.scraped_at,
+            }
             
             # Create chunks for large content
-            if book.full_content and len(book.full_content) > chunk_size:
-                chunks = self._split_text_into_chunks(book.full_content, chunk_size)
+            if len(full_content) > chunk_size:
+                chunks = self._split_text_into_chunks(full_content, chunk_size)
                 
-                for i, chunk in enumerate(chunks):
-                    chunk_text = YggdrasilText(
-                        title=f"{book.title} - Part {i+1}",
-                        content_type=book.content_type,
-                        domain=book.domain,
-                        language=book.language,
+                for i, chunk in enumerate(chunks, 1):
+                    pending.append(YggdrasilText(
+                        title=f"{title_prefix}Part {i}",
                         content=chunk,
-                        author=book.author,
-                        source_url=book.source_url,
-                        parent_text_id=main_text.id,
-                        chunk_sequence=i+1,
-                        category_id=category.id,
+                        chunk_sequence=i,
                         word_count=len(chunk.split()),
-                        scraped_at=datetime.utcnow()
-                    )
-                    session.add(chunk_text)
-                    chunks_created += 1
+                        **child_fields
+                    ))
+            
+            chunks_created = len(pending)
             
             # Store individual chapters if available
             if book.chapters:
                 for chapter in book.chapters:
-                    chapter_text = YggdrasilText(
-                        title=f"{book.title} - {chapter.title}",
-                        content_type=book.content_type,
-                        domain=book.domain,
-                        language=book.language,
+                    pending.append(YggdrasilText(
+                        title=title_prefix + chapter.title,
                         content=chapter.content,
-                        author=book.author,
-                        source_url=book.source_url,
-                        parent_text_id=main_text.id,
                         current_chapter=chapter.chapter_number,
                         chapter_title=chapter.title,
-                        category_id=category.id,
                         word_count=len(chapter.content.split()),
-                        scraped_at=datetime.utcnow()
-                    )
-                    session.add(chapter_text)
+                        **child_fields
+                    ))
             
+            # Insert all child rows and commit the book in one transaction
+            session.add_all(pending)
             await session.commit()
             
             return {
@@ -199,7 +232,7 @@ class YggdrasilScrapingManager(HybridScrapingManager):
                 "title": book.title,
                 "chunks_created": chunks_created,
                 "chapters_stored": len(book.chapters) if book.chapters else 0,
-                "total_words": len(book.full_content.split()) if book.full_content else 0
+                "total_words": total_words
             }
             
         except Exception as e:
@@ -214,7 +247,7 @@ class YggdrasilScrapingManager(HybridScrapingManager):
         session = self.db_manager.get_session()
         
         try:
-            category = await self._get_or_create_category(paper.domain, session)
+            category_id = await self._get_category_id(paper.domain, session)
             
             text = YggdrasilText(
                 title=paper.title,
@@ -228,7 +261,7 @@ class YggdrasilScrapingManager(HybridScrapingManager):
                 arxiv_id=paper.arxiv_id,
                 publication_date=paper.publication_date,
                 keywords=paper.keywords,
-                category_id=category.id,
+                category_id=category_id,
                 word_count=len(paper.content.split()),
                 scraped_at=datetime.utcnow(),
                 metadata={
@@ -248,47 +281,67 @@ class YggdrasilScrapingManager(HybridScrapingManager):
         finally:
             session.close()
     
+    async def _get_category_id(self, domain: KnowledgeDomain, session):
+        """Get the category id for a domain, querying the database only once per domain."""
+        category_id = self._category_ids.get(domain)
+        
+        if category_id is None:
+            category = await self._get_or_create_category(domain, session)
+            category_id = self._category_ids[domain] = category.id
+        
+        return category_id
+    
     async def _get_or_create_category(self, 
                                     domain: KnowledgeDomain, 
                                     session) -> KnowledgeCategory:
         """Get or create a knowledge category."""
         
+        category_name = _DOMAIN_TITLE[domain]
+        
         category = session.query(KnowledgeCategory).filter(
             KnowledgeCategory.domain == domain,
-            KnowledgeCategory.category_name == domain.value.title()
+            KnowledgeCategory.category_name == category_name
         ).first()
         
         if not category:
             category = KnowledgeCategory(
                 domain=domain,
-                category_name=domain.value.title(),
-                description=f"Content related to {domain.value}"
+                category_name=category_name,
+                description=_DOMAIN_DESC[domain]
             )
             session.add(category)
             await session.commit()
         
         return category
     
+    def _source_format(self, source_url: str) -> str:
+        """Get the file extension (e.g. '.pdf') of a source URL or path, if any."""
+        name = urlparse(source_url).path.rpartition('/')[2]
+        dot = name.rfind('.')
+        return name[dot:] if 0 < dot < len(name) - 1 else ''
+    
     def _split_text_into_chunks(self, text: str, chunk_size: int) -> List[str]:
         """Split text into chunks of approximately chunk_size characters."""
         
         chunks = []
-        words = text.split()
-        current_chunk = []
-        current_length = 0
+        start = 0
+        length = len(text)
         
-        for word in words:
-            word_length = len(word) + 1  # +1 for space
+        while start < length:
+            end = min(start + chunk_size, length)
             
-            if current_length + word_length > chunk_size and current_chunk:
-                chunks.append(' '.join(current_chunk))
-                current_chunk = [word]
-                current_length = word_length
-            else:
-                current_chunk.append(word)
-                current_length += word_length
-        
-        if current_chunk:
-            chunks.append(' '.join(current_chunk))
+            # Break on the last whitespace inside the window; an overlong word gets its own chunk
+            if end < length:
+                last = _LAST_WHITESPACE.match(text, start, end + 1)
+                if last and last.end() - 1 > start:
+                    end = last.end() - 1
+                else:
+                    following = _WHITESPACE.search(text, end)
+                    end = following.start() if following else length
+            
+            chunk = text[start:end].strip()
+            if chunk:
+                chunks.append(chunk)
+            start = end + 1 if end < length and text[end].isspace() else end
         
         return chunks
@@ -1,11 +1,41 @@
 """Standardized logging configuration for Yggdrasil project."""
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from yggdrasil.config import settings
 
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s"
+
+# Third-party loggers that are only shown at WARNING and above
+QUIET_LOGGERS = (
+    "httpx",
+    "sqlalchemy.engine",
+    "qdrant_client",
+    "transformers",
+    "sentence_transformers",
+)
+
+
+def log_file_handler(path: Path) -> logging.Handler:
+    """Create a rotating file handler that buffers records and writes them in batches."""
+    file_handler = logging.handlers.RotatingFileHandler(
+        path, maxBytes=50_000_000, backupCount=5, encoding="utf-8"
+    )
+    # The buffer hands records straight to this handler, so it needs its own formatter
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    # Records are written once 1024 accumulate, immediately on ERROR,
+    # and on interpreter exit when logging.shutdown() closes the handler
+    return logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+
+
 def setup_logging():
     """Configure standardized logging across the application."""
     
@@ -15,19 +45,16 @@ def setup_logging():
     # Configure root logger
     logging.basicConfig(
         level=getattr(logging, settings.log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s",
+        format=LOG_FORMAT,
         handlers=[
-            logging.FileHandler(settings.logs_dir / "yggdrasil.log"),
+            log_file_handler(settings.logs_dir / "yggdrasil.log"),
             logging.StreamHandler(sys.stdout)
         ]
     )
     
     # Set specific log levels for libraries
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
-    logging.getLogger("qdrant_client").setLevel(logging.WARNING)
-    logging.getLogger("transformers").setLevel(logging.WARNING)
-    logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
     
     logger = logging.getLogger(__name__)
     logger.info("Yggdrasil logging system initialized")
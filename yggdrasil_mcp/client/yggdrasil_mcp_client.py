@@ -5,18 +5,107 @@ Provides easy-to-use interface for the Yggdrasil MCP server
 """
 
 import asyncio
-import json
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-from dataclasses import dataclass
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, List, Any, Optional
+from dataclasses import asdict, dataclass
 
 # MCP client imports
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps_pretty(data: Any) -> str:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps_pretty(data: Any) -> str:
+        return json.dumps(data, indent=2)
+
 logger = logging.getLogger(__name__)
 
+# Environment variable naming a running server to connect to instead of
+# spawning one, e.g. http://127.0.0.1:8765/sse
+SERVER_URL_ENV_VAR = "YGGDRASIL_MCP_SERVER_URL"
+
+# Environment variable overriding the default batch concurrency
+CONCURRENCY_ENV_VAR = "YGGDRASIL_MCP_CONCURRENCY"
+
+# Environment variable that silences printed summaries when stdout is not a terminal
+QUIET_ENV_VAR = "YGGDRASIL_QUIET"
+
+# Number of completed URLs between batch progress log lines
+PROGRESS_LOG_INTERVAL = 100
+
+
+def _concurrency(max_concurrent: Optional[int], fallback: int) -> int:
+    """Batch concurrency: max_concurrent if given, else the environment, else fallback
+
+    The result is at least 1 so a batch always gets a worker; a non-integer
+    environment value is ignored.
+    """
+    if max_concurrent is None:
+        max_concurrent = fallback
+        value = os.environ.get(CONCURRENCY_ENV_VAR)
+        if value:
+            try:
+                max_concurrent = int(value)
+            except ValueError:
+                logger.warning("Ignoring non-integer %s=%r", CONCURRENCY_ENV_VAR, value)
+    return max(1, max_concurrent)
+
+
+# Header lines older servers put in front of each tool's JSON payload
+_ANALYZE_MARKER = "Data Source Analysis:\n"
+_SCRAPE_MARKER = "Scraping completed successfully:\n"
+_OPTIMIZE_MARKER = "Storage optimization complete:\n"
+_PERFORMANCE_MARKER = "Performance Report:\n"
+_AI_ANALYSIS_MARKER = "AI Content Analysis Results:\n"
+_ANALYSIS_TYPES_MARKER = "Available AI Analysis Types:\n"
+_AGENT_PERFORMANCE_MARKER = "Agent Performance Report:\n"
+
+
+def _extract_after(text: str, marker: str) -> str:
+    """Return the part of text following marker, or "" if marker is absent"""
+    idx = text.find(marker)
+    return text[idx + len(marker):] if idx >= 0 else ""
+
+def _parse_payload(text: str, marker: str) -> Any:
+    """Parse a tool result's JSON payload, or return None if it has none
+
+    The server sends the JSON on its own; older servers prefix it with a
+    human-readable marker line, which is stripped before parsing.
+    """
+    try:
+        return _loads(text)
+    except ValueError:
+        pass
+    payload = _extract_after(text, marker)
+    return _loads(payload) if payload else None
+
+def _parse_result(result, marker: str) -> Any:
+    """Parse a tool call result, wrapping non-JSON text as {"raw_response": text}"""
+    # Servers that send structured content have already done the decoding
+    structured = getattr(result, "structuredContent", None)
+    if structured is not None:
+        return structured
+    
+    text = result.content[0].text if result.content else ""
+    data = _parse_payload(text, marker)
+    return data if data is not None else {"raw_response": text}
+
+
 @dataclass
 class ProcessingResult:
     """Result of content processing"""
@@ -26,34 +115,58 @@ class ProcessingResult:
     storage_info: Optional[Dict[str, Any]] = None
     error_message: Optional[str] = None
     processing_time: Optional[float] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form of the result, for callers that want JSON instead of a printed summary"""
+        return asdict(self)
 
 class YggdrasilMCPClient:
     """Client for interacting with Yggdrasil MCP server"""
     
-    def __init__(self, server_path: str = None):
+    def __init__(self, server_path: str = None, server_url: str = None):
         self.server_path = server_path or "/Users/grant/Desktop/Solomon/Database/S.IO/yggdrasil_mcp_server.py"
+        # URL of a long-running server (started with --transport sse); when
+        # unset, each connect spawns the server at server_path over stdio
+        self.server_url = server_url or os.environ.get(SERVER_URL_ENV_VAR)
         self.context_manager = None
         self.session = None
+        self._connect_lock = asyncio.Lock()
         
     async def connect(self):
-        """Connect to the MCP server"""
-        try:
-            server_params = StdioServerParameters(
-                command="python3",
-                args=[self.server_path]
-            )
-            
-            self.context_manager = stdio_client(server_params)
-            # The stdio_client context manager returns (read, write) streams
-            # We need to create the ClientSession from these streams
-            read_stream, write_stream = await self.context_manager.__aenter__()
-            self.session = ClientSession(read_stream, write_stream)
-            await self.session.__aenter__()
-            logger.info("Connected to Yggdrasil MCP server")
+        """Connect to the MCP server (does nothing if already connected)"""
+        async with self._connect_lock:
+            if self.session:
+                return
             
-        except Exception as e:
-            logger.error(f"Failed to connect to MCP server: {e}")
-            raise
+            try:
+                if self.server_url:
+                    # Imported here so stdio-only use does not load the HTTP/SSE stack
+                    from mcp.client.sse import sse_client
+                    self.context_manager = sse_client(self.server_url)
+                else:
+                    server_params = StdioServerParameters(
+                        command="python3",
+                        args=[self.server_path]
+                    )
+                    self.context_manager = stdio_client(server_params)
+                
+                # The client context manager returns (read, write) streams
+                # We need to create the ClientSession from these streams
+                read_stream, write_stream = await self.context_manager.__aenter__()
+                session = ClientSession(read_stream, write_stream)
+                await session.__aenter__()
+                # Only publish the session once it is fully set up
+                self.session = session
+                logger.info("Connected to Yggdrasil MCP server")
+                
+            except Exception as e:
+                logger.error("Failed to connect to MCP server: %s", e)
+                raise
+    
+    async def _ensure_connected(self):
+        """Connect on first use; concurrent callers share a single connection attempt"""
+        if not self.session:
+            await self.connect()
     
     async def disconnect(self):
         """Disconnect from the MCP server"""
@@ -68,10 +181,9 @@ class YggdrasilMCPClient:
     async def analyze_url(self, url: str) -> ProcessingResult:
         """Analyze a URL to determine optimal storage strategy"""
         
-        if not self.session:
-            await self.connect()
+        await self._ensure_connected()
         
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         
         try:
             result = await self.session.call_tool(
@@ -80,10 +192,11 @@ class YggdrasilMCPClient:
             )
             
             # Parse the result
-            result_text = result.content[0].text if result.content else "{}"
-            analysis_data = json.loads(result_text.split("Data Source Analysis:\n")[1])
+            analysis_data = _parse_result(result, _ANALYZE_MARKER)
+            if "raw_response" in analysis_data:
+                raise ValueError(analysis_data["raw_response"])
             
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             
             return ProcessingResult(
                 success=True,
@@ -93,8 +206,8 @@ class YggdrasilMCPClient:
             )
             
         except Exception as e:
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
-            logger.error(f"Error analyzing URL {url}: {e}")
+            processing_time = time.perf_counter() - start_time
+            logger.error("Error analyzing URL %s: %s", url, e)
             
             return ProcessingResult(
                 success=False,
@@ -106,10 +219,9 @@ class YggdrasilMCPClient:
     async def intelligent_scrape(self, url: str, force_analysis: bool = False) -> ProcessingResult:
         """Intelligently scrape and store content"""
         
-        if not self.session:
-            await self.connect()
+        await self._ensure_connected()
         
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         
         try:
             result = await self.session.call_tool(
@@ -118,13 +230,9 @@ class YggdrasilMCPClient:
             )
             
             # Parse the result
-            result_text = result.content[0].text if result.content else "{}"
-            if "Scraping completed successfully:" in result_text:
-                storage_data = json.loads(result_text.split("Scraping completed successfully:\n")[1])
-            else:
-                storage_data = {"raw_response": result_text}
+            storage_data = _parse_result(result, _SCRAPE_MARKER)
             
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             
             return ProcessingResult(
                 success=True,
@@ -134,8 +242,8 @@ class YggdrasilMCPClient:
             )
             
         except Exception as e:
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
-            logger.error(f"Error scraping URL {url}: {e}")
+            processing_time = time.perf_counter() - start_time
+            logger.error("Error scraping URL %s: %s", url, e)
             
             return ProcessingResult(
                 success=False,
@@ -147,8 +255,7 @@ class YggdrasilMCPClient:
     async def optimize_storage(self, table_name: str = None) -> Dict[str, Any]:
         """Optimize storage performance"""
         
-        if not self.session:
-            await self.connect()
+        await self._ensure_connected()
         
         try:
             result = await self.session.call_tool(
@@ -156,21 +263,16 @@ class YggdrasilMCPClient:
                 {"table_name": table_name} if table_name else {}
             )
             
-            result_text = result.content[0].text if result.content else "{}"
-            if "Storage optimization complete:" in result_text:
-                return json.loads(result_text.split("Storage optimization complete:\n")[1])
-            else:
-                return {"raw_response": result_text}
+            return _parse_result(result, _OPTIMIZE_MARKER)
             
         except Exception as e:
-            logger.error(f"Error optimizing storage: {e}")
+            logger.error("Error optimizing storage: %s", e)
             return {"error": str(e)}
     
     async def get_performance_report(self, domain: str = None) -> Dict[str, Any]:
         """Get query performance report"""
         
-        if not self.session:
-            await self.connect()
+        await self._ensure_connected()
         
         try:
             result = await self.session.call_tool(
@@ -178,86 +280,100 @@ class YggdrasilMCPClient:
                 {"domain": domain} if domain else {}
             )
             
-            result_text = result.content[0].text if result.content else "{}"
-            if "Performance Report:" in result_text:
-                return json.loads(result_text.split("Performance Report:\n")[1])
-            else:
-                return {"raw_response": result_text}
+            return _parse_result(result, _PERFORMANCE_MARKER)
             
         except Exception as e:
-            logger.error(f"Error getting performance report: {e}")
+            logger.error("Error getting performance report: %s", e)
             return {"error": str(e)}
     
-    async def batch_process_urls(self, urls: List[str], max_concurrent: int = 5) -> List[ProcessingResult]:
-        """Process multiple URLs concurrently"""
-        
-        logger.info(f"Processing {len(urls)} URLs with max concurrency of {max_concurrent}")
+    async def batch_process_urls(self, urls: List[str], max_concurrent: Optional[int] = None,
+                                 analyze_first: bool = True) -> List[ProcessingResult]:
+        """Process multiple URLs concurrently
+
+        Each URL is scraped only once its analysis has succeeded; set
+        analyze_first=False to run both in parallel, which also scrapes and
+        stores URLs whose analysis fails.
+        """
         
-        semaphore = asyncio.Semaphore(max_concurrent)
+        max_concurrent = _concurrency(max_concurrent, 32)
+        logger.info("Processing %d URLs with max concurrency of %d", len(urls), max_concurrent)
         
         async def process_single_url(url):
-            async with semaphore:
-                # First analyze
+            if analyze_first:
+                # Only scrape once the analysis has succeeded
                 analysis_result = await self.analyze_url(url)
                 if not analysis_result.success:
                     return analysis_result
-                
-                # Then scrape if analysis successful
                 scrape_result = await self.intelligent_scrape(url)
-                
-                # Combine results
-                return ProcessingResult(
-                    success=scrape_result.success,
-                    url=url,
-                    analysis=analysis_result.analysis,
-                    storage_info=scrape_result.storage_info,
-                    error_message=scrape_result.error_message,
-                    processing_time=(analysis_result.processing_time or 0) + (scrape_result.processing_time or 0)
+            else:
+                # The scrape does not use the analysis, so run both at once
+                analysis_result, scrape_result = await asyncio.gather(
+                    self.analyze_url(url),
+                    self.intelligent_scrape(url)
                 )
+                if not analysis_result.success:
+                    return analysis_result
+            
+            # Combine results
+            return ProcessingResult(
+                success=scrape_result.success,
+                url=url,
+                analysis=analysis_result.analysis,
+                storage_info=scrape_result.storage_info,
+                error_message=scrape_result.error_message,
+                processing_time=(analysis_result.processing_time or 0) + (scrape_result.processing_time or 0)
+            )
         
-        tasks = [process_single_url(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Convert exceptions to error results
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append(ProcessingResult(
-                    success=False,
-                    url=urls[i],
-                    error_message=str(result)
-                ))
-            else:
-                processed_results.append(result)
+        # A fixed pool of workers pulls URLs from a shared iterator, so a large
+        # batch costs max_concurrent tasks rather than one task per URL
+        results: List[Optional[ProcessingResult]] = [None] * len(urls)
+        pending = iter(enumerate(urls))
+        total = len(urls)
+        completed = 0
+        
+        async def worker():
+            nonlocal completed
+            for i, url in pending:
+                try:
+                    results[i] = await process_single_url(url)
+                except Exception as e:
+                    # Convert exceptions to error results
+                    results[i] = ProcessingResult(
+                        success=False,
+                        url=url,
+                        error_message=str(e)
+                    )
+                
+                completed += 1
+                if completed % PROGRESS_LOG_INTERVAL == 0:
+                    logger.info("Processed %d/%d URLs", completed, total)
         
-        return processed_results
+        # Workers convert failures into results, so one bad URL never cancels the rest
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(min(max_concurrent, len(urls))):
+                tg.create_task(worker())
+        
+        return results
     
     async def ai_content_analysis(self, text: str, analysis_type: str, **kwargs) -> ProcessingResult:
         """Perform AI-powered content analysis"""
         
-        if not self.session:
-            await self.connect()
+        await self._ensure_connected()
         
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         
         try:
             # Prepare arguments
-            args = {
-                "text": text,
-                "analysis_type": analysis_type,
-                **kwargs
-            }
+            args = {"text": text, "analysis_type": analysis_type}
+            if kwargs:
+                args.update(kwargs)
             
             result = await self.session.call_tool("ai_content_analysis", args)
             
             # Parse the result
-            result_text = result.content[0].text if result.content else "{}"
-            if "AI Content Analysis Results:" in result_text:
-                analysis_data = json.loads(result_text.split("AI Content Analysis Results:\n")[1])
-            else:
-                analysis_data = {"raw_response": result_text}
+            analysis_data = _parse_result(result, _AI_ANALYSIS_MARKER)
             
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             
             return ProcessingResult(
                 success=analysis_data.get("success", False),
@@ -267,8 +383,8 @@ class YggdrasilMCPClient:
             )
             
         except Exception as e:
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
-            logger.error(f"Error in AI content analysis: {e}")
+            processing_time = time.perf_counter() - start_time
+            logger.error("Error in AI content analysis: %s", e)
             
             return ProcessingResult(
                 success=False,
@@ -280,150 +396,262 @@ class YggdrasilMCPClient:
     async def get_analysis_types(self) -> List[Dict[str, str]]:
         """Get available AI analysis types"""
         
-        if not self.session:
-            await self.connect()
+        await self._ensure_connected()
         
         try:
             result = await self.session.call_tool("get_analysis_types", {})
             
-            result_text = result.content[0].text if result.content else "[]"
-            if "Available AI Analysis Types:" in result_text:
-                return json.loads(result_text.split("Available AI Analysis Types:\n")[1])
-            else:
-                return []
+            analysis_types = _parse_result(result, _ANALYSIS_TYPES_MARKER)
+            return analysis_types if isinstance(analysis_types, list) else []
             
         except Exception as e:
-            logger.error(f"Error getting analysis types: {e}")
+            logger.error("Error getting analysis types: %s", e)
             return []
     
     async def get_agent_performance(self) -> Dict[str, Any]:
         """Get AI agent performance statistics"""
         
-        if not self.session:
-            await self.connect()
+        await self._ensure_connected()
         
         try:
             result = await self.session.call_tool("agent_performance_report", {})
             
-            result_text = result.content[0].text if result.content else "{}"
-            if "Agent Performance Report:" in result_text:
-                return json.loads(result_text.split("Agent Performance Report:\n")[1])
-            else:
-                return {"raw_response": result_text}
+            return _parse_result(result, _AGENT_PERFORMANCE_MARKER)
             
         except Exception as e:
-            logger.error(f"Error getting agent performance: {e}")
+            logger.error("Error getting agent performance: %s", e)
             return {"error": str(e)}
 
     def print_analysis_summary(self, result: ProcessingResult):
         """Print a formatted analysis summary"""
         
-        print(f"\n{'='*60}")
-        print(f"ANALYSIS SUMMARY: {result.url}")
-        print(f"{'='*60}")
+        # Headless runs can opt out of formatting summaries nobody will read
+        if os.environ.get(QUIET_ENV_VAR) and not sys.stdout.isatty():
+            return
+        
+        # Collect the summary and write it in one call rather than per line
+        lines = []
+        lines.append(f"\n{'='*60}")
+        lines.append(f"ANALYSIS SUMMARY: {result.url}")
+        lines.append(f"{'='*60}")
         
         if not result.success:
-            print(f"❌ FAILED: {result.error_message}")
+            lines.append(f"❌ FAILED: {result.error_message}")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
         
         if result.analysis:
             analysis = result.analysis
-            print(f"✅ SUCCESS")
+            lines.append(f"✅ SUCCESS")
             
             # Handle different types of analysis results
             if "analysis_type" in analysis:
-                print(f"Analysis Type: {analysis.get('analysis_type', 'Unknown')}")
+                lines.append(f"Analysis Type: {analysis.get('analysis_type', 'Unknown')}")
                 
                 # Display results based on analysis type
                 results = analysis.get("results", {})
                 
                 if "detected_themes" in results:
-                    print(f"\n🎯 Detected Themes:")
+                    lines.append(f"\n🎯 Detected Themes:")
                     for theme in results["detected_themes"][:3]:  # Show top 3
-                        print(f"  - {theme.get('theme_name', 'Unknown')}: {theme.get('confidence_score', 0):.2f}")
+                        lines.append(f"  - {theme.get('theme_name', 'Unknown')}: {theme.get('confidence_score', 0):.2f}")
                 
                 if "detected_doctrines" in results:
-                    print(f"\n📜 Detected Doctrines:")
+                    lines.append(f"\n📜 Detected Doctrines:")
                     for doctrine in results["detected_doctrines"][:3]:
-                        print(f"  - {doctrine.get('doctrine_name', 'Unknown')}: {doctrine.get('confidence_score', 0):.2f}")
+                        lines.append(f"  - {doctrine.get('doctrine_name', 'Unknown')}: {doctrine.get('confidence_score', 0):.2f}")
                 
                 if "detected_fallacies" in results:
-                    print(f"\n⚠️  Detected Fallacies:")
+                    lines.append(f"\n⚠️  Detected Fallacies:")
                     for fallacy in results["detected_fallacies"][:3]:
-                        print(f"  - {fallacy.get('fallacy_type', 'Unknown')}: {fallacy.get('confidence_score', 0):.2f}")
+                        lines.append(f"  - {fallacy.get('fallacy_type', 'Unknown')}: {fallacy.get('confidence_score', 0):.2f}")
                 
                 if "storage_strategy" in results:
-                    print(f"\n💾 Storage Strategy: {results['storage_strategy']}")
-                    print(f"Confidence: {results.get('confidence_score', 0):.2f}")
+                    lines.append(f"\n💾 Storage Strategy: {results['storage_strategy']}")
+                    lines.append(f"Confidence: {results.get('confidence_score', 0):.2f}")
                 
                 if "complexity_metrics" in results:
                     metrics = results["complexity_metrics"]
-                    print(f"\n📊 Complexity Metrics:")
-                    print(f"  Semantic Complexity: {metrics.get('semantic_complexity', 0):.2f}")
-                    print(f"  Topic Coherence: {metrics.get('topic_coherence', 0):.2f}")
-                    print(f"  Information Density: {metrics.get('information_density', 0):.2f}")
-                    print(f"  Query Potential: {metrics.get('query_potential', 0):.2f}")
+                    lines.append(f"\n📊 Complexity Metrics:")
+                    lines.append(f"  Semantic Complexity: {metrics.get('semantic_complexity', 0):.2f}")
+                    lines.append(f"  Topic Coherence: {metrics.get('topic_coherence', 0):.2f}")
+                    lines.append(f"  Information Density: {metrics.get('information_density', 0):.2f}")
+                    lines.append(f"  Query Potential: {metrics.get('query_potential', 0):.2f}")
             
             else:
                 # Legacy analysis format
-                print(f"Content Type: {analysis.get('content_type', 'Unknown')}")
-                print(f"Domain: {analysis.get('domain', 'Unknown')}")
-                print(f"Estimated Size: {self._format_size(analysis.get('estimated_size', 0))}")
-                print(f"Language: {analysis.get('language', 'Unknown')}")
-                print(f"Storage Strategy: {analysis.get('storage_strategy', 'Unknown')}")
-                print(f"Confidence Score: {analysis.get('confidence_score', 0):.2f}")
+                lines.append(f"Content Type: {analysis.get('content_type', 'Unknown')}")
+                lines.append(f"Domain: {analysis.get('domain', 'Unknown')}")
+                lines.append(f"Estimated Size: {self._format_size(analysis.get('estimated_size', 0))}")
+                lines.append(f"Language: {analysis.get('language', 'Unknown')}")
+                lines.append(f"Storage Strategy: {analysis.get('storage_strategy', 'Unknown')}")
+                lines.append(f"Confidence Score: {analysis.get('confidence_score', 0):.2f}")
                 
                 if analysis.get('table_name'):
-                    print(f"Dynamic Table: {analysis['table_name']}")
+                    lines.append(f"Dynamic Table: {analysis['table_name']}")
                 
                 # Complexity metrics
-                print(f"\nComplexity Metrics:")
-                print(f"  Semantic Complexity: {analysis.get('complexity_score', 0):.2f}")
+                lines.append(f"\nComplexity Metrics:")
+                lines.append(f"  Semantic Complexity: {analysis.get('complexity_score', 0):.2f}")
         
         if result.storage_info:
-            print(f"\nStorage Information:")
-            print(f"  Status: {result.storage_info.get('status', 'Unknown')}")
+            lines.append(f"\nStorage Information:")
+            lines.append(f"  Status: {result.storage_info.get('status', 'Unknown')}")
             
         if result.processing_time:
-            print(f"\nProcessing Time: {result.processing_time:.2f} seconds")
+            lines.append(f"\nProcessing Time: {result.processing_time:.2f} seconds")
         
-        print(f"{'='*60}\n")
+        lines.append(f"{'='*60}\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
+    SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+    
     def _format_size(self, size_bytes: int) -> str:
         """Format size in human-readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024
-        return f"{size_bytes:.1f} TB"
+        if size_bytes < 1024:
+            return f"{size_bytes:.1f} B"
+        # Each unit is 2**10 times the previous one
+        unit = min((int(size_bytes).bit_length() - 1) // 10, 4)
+        return f"{size_bytes / (1 << (unit * 10)):.1f} {self.SIZE_UNITS[unit]}"
 
-# Convenience functions for common use cases
-async def quick_analyze(url: str) -> ProcessingResult:
-    """Quick analysis of a single URL"""
-    client = YggdrasilMCPClient()
-    try:
-        result = await client.analyze_url(url)
-        return result
-    finally:
-        await client.disconnect()
+class YggdrasilMCPClientPool:
+    """Pool of connected clients, each holding its own server session
 
-async def smart_scrape(url: str) -> ProcessingResult:
-    """Smart scraping of a single URL"""
-    client = YggdrasilMCPClient()
+    Clients are connected lazily, up to size, when acquire() finds none idle.
+    Spreading calls over several sessions keeps one slow tool call from
+    holding up everything queued behind it on a single connection.
+    """
+    
+    def __init__(self, size: int = 4, **client_kwargs):
+        self.size = size
+        self.client_kwargs = client_kwargs
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._clients: List[YggdrasilMCPClient] = []  # Every client created, idle or borrowed
+        self._connecting = 0
+    
+    async def acquire(self) -> YggdrasilMCPClient:
+        """Take an idle client, connecting a new one if the pool is not full"""
+        if self._idle.empty() and len(self._clients) + self._connecting < self.size:
+            self._connecting += 1
+            client = YggdrasilMCPClient(**self.client_kwargs)
+            try:
+                await client.connect()
+            finally:
+                self._connecting -= 1
+            self._clients.append(client)
+            return client
+        return await self._idle.get()
+    
+    def release(self, client: YggdrasilMCPClient):
+        """Return a client taken with acquire() to the pool"""
+        # Clients borrowed before close() were disconnected by it; drop them
+        if client in self._clients:
+            self._idle.put_nowait(client)
+    
+    @asynccontextmanager
+    async def client(self) -> AsyncIterator[YggdrasilMCPClient]:
+        """Borrow a client for the duration of the block"""
+        client = await self.acquire()
+        try:
+            yield client
+        finally:
+            self.release(client)
+    
+    async def batch_process_urls(self, urls: List[str], max_concurrent: Optional[int] = None,
+                                 analyze_first: bool = True) -> List[ProcessingResult]:
+        """Process multiple URLs, spreading them across the pool's sessions"""
+        if not urls:
+            return []
+        
+        max_concurrent = _concurrency(max_concurrent, 32)
+        clients: List[YggdrasilMCPClient] = []
+        
+        try:
+            clients.append(await self.acquire())
+            while len(clients) < min(self.size, len(urls)) and (
+                not self._idle.empty() or len(self._clients) + self._connecting < self.size
+            ):
+                clients.append(await self.acquire())
+            
+            # Client k takes every n-th URL starting at k; its results go back
+            # into the same positions, so the output stays in input order
+            n = len(clients)
+            per_client = max(1, -(-max_concurrent // n))
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(client.batch_process_urls(urls[k::n], per_client, analyze_first))
+                    for k, client in enumerate(clients)
+                ]
+            parts = [task.result() for task in tasks]
+        finally:
+            for client in clients:
+                self.release(client)
+        
+        results: List[ProcessingResult] = [None] * len(urls)
+        for k, part in enumerate(parts):
+            results[k::n] = part
+        return results
+    
+    async def close(self):
+        """Disconnect every client the pool created, including borrowed ones"""
+        clients, self._clients = self._clients, []
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        for client in clients:
+            await client.disconnect()
+
+# Pool shared by the convenience functions called inside a default_pool() block
+_default_pool: ContextVar[Optional[YggdrasilMCPClientPool]] = ContextVar("_default_pool", default=None)
+
+@asynccontextmanager
+async def default_pool(**pool_kwargs) -> AsyncIterator[YggdrasilMCPClientPool]:
+    """Share one client pool across the convenience functions called in the block
+
+    Their server connections are reused until the block exits, which shuts
+    the servers down. A nested block reuses the enclosing pool.
+    """
+    pool = _default_pool.get()
+    if pool is not None:
+        yield pool
+        return
+    
+    pool = YggdrasilMCPClientPool(**pool_kwargs)
+    token = _default_pool.set(pool)
     try:
-        result = await client.intelligent_scrape(url)
-        return result
+        yield pool
     finally:
-        await client.disconnect()
+        _default_pool.reset(token)
+        await pool.close()
 
-async def batch_smart_scrape(urls: List[str], max_concurrent: int = 3) -> List[ProcessingResult]:
-    """Batch smart scraping of multiple URLs"""
-    client = YggdrasilMCPClient()
+@asynccontextmanager
+async def _helper_pool(**pool_kwargs) -> AsyncIterator[YggdrasilMCPClientPool]:
+    """The default_pool() in effect, or a new pool closed after the call"""
+    pool = _default_pool.get()
+    if pool is not None:
+        yield pool
+        return
+    
+    pool = YggdrasilMCPClientPool(**pool_kwargs)
     try:
-        results = await client.batch_process_urls(urls, max_concurrent)
-        return results
+        yield pool
     finally:
-        await client.disconnect()
+        await pool.close()
+
+# Convenience functions for common use cases
+async def quick_analyze(url: str) -> ProcessingResult:
+    """Quick analysis of a single URL (reusing connections inside default_pool())"""
+    async with _helper_pool(size=1) as pool, pool.client() as client:
+        return await client.analyze_url(url)
+
+async def smart_scrape(url: str) -> ProcessingResult:
+    """Smart scraping of a single URL (reusing connections inside default_pool())"""
+    async with _helper_pool(size=1) as pool, pool.client() as client:
+        return await client.intelligent_scrape(url)
+
+async def batch_smart_scrape(urls: List[str], max_concurrent: Optional[int] = None) -> List[ProcessingResult]:
+    """Batch smart scraping of multiple URLs (reusing connections inside default_pool())"""
+    async with _helper_pool() as pool:
+        return await pool.batch_process_urls(urls, _concurrency(max_concurrent, 16))
 
 # CLI Interface
 async def main():
@@ -437,7 +665,7 @@ async def main():
     parser.add_argument("--urls-file", help="File containing URLs to process (for batch)")
     parser.add_argument("--domain", help="Domain for reports")
     parser.add_argument("--table", help="Table name for optimization")
-    parser.add_argument("--concurrent", type=int, default=3, help="Max concurrent processing")
+    parser.add_argument("--concurrent", type=int, help=f"Max concurrent processing (default: ${CONCURRENCY_ENV_VAR} or 32)")
     parser.add_argument("--text", help="Text to analyze (for ai_analyze)")
     parser.add_argument("--analysis-type", help="Analysis type (for ai_analyze)")
     
@@ -473,7 +701,7 @@ async def main():
             
             try:
                 with open(args.urls_file, 'r') as f:
-                    urls = [line.strip() for line in f if line.strip()]
+                    urls = [url for url in map(str.strip, f.read().splitlines()) if url]
             except FileNotFoundError:
                 print(f"❌ URLs file not found: {args.urls_file}")
                 return
@@ -499,12 +727,12 @@ async def main():
         elif args.command == "optimize":
             print("🔧 Optimizing storage...")
             result = await client.optimize_storage(args.table)
-            print(json.dumps(result, indent=2))
+            print(_dumps_pretty(result))
         
         elif args.command == "report":
             print("📈 Generating performance report...")
             result = await client.get_performance_report(args.domain)
-            print(json.dumps(result, indent=2))
+            print(_dumps_pretty(result))
         
         elif args.command == "ai_analyze":
             if not args.text:
@@ -529,4 +757,10 @@ if __name__ == "__main__":
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
-    asyncio.run(main())
+    # Use the libuv-based event loop when available (pip install uvloop)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -5,14 +5,18 @@ Advanced MCP server with AI agents for smart scraping and storage decisions
 """
 
 import asyncio
-import json
 import logging
 import hashlib
+import html
+import re
+import time
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Union, Tuple
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 # MCP imports
 from mcp.server import Server
@@ -25,14 +29,17 @@ from mcp.types import (
 )
 
 # Database and AI imports
-import psycopg2
-from sqlalchemy import create_engine, text, MetaData, Table, Column, Integer, String, Text, Float, DateTime, Boolean
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import MetaData, Table, Column, Integer, String, Text, Float, DateTime, Boolean
+from sqlalchemy.ext.asyncio import create_async_engine
 import httpx
-from bs4 import BeautifulSoup
-import spacy
+import orjson
 from sentence_transformers import SentenceTransformer
 
+try:
+    import gcld3
+except ImportError:
+    gcld3 = None
+
 # Import our agent manager
 import sys
 sys.path.append(str(Path(__file__).parent / 'yggdrasil'))
@@ -42,6 +49,50 @@ from yggdrasil.agents.mcp_agent_manager import MCPAgentManager, MCPAnalysisReque
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# --- precompiled analyzers ---
+# Built once at import and immutable afterwards, so they are safe to share across tasks and threads
+
+# Keywords identifying each content domain, in classification priority order
+_DOMAIN_KEYWORDS = {
+    "religion": ["bible", "quran", "torah", "buddhist", "spiritual", "religious"],
+    "philosophy": ["philosophy", "philosophical", "ethics", "metaphysics", "logic"],
+    "science": ["science", "scientific", "research", "study", "analysis"],
+    "literature": ["literature", "novel", "poetry", "fiction", "literary"],
+    "history": ["history", "historical", "ancient", "medieval", "modern"],
+    "technology": ["technology", "technical", "computer", "software", "programming"],
+    "medicine": ["medical", "medicine", "health", "clinical", "patient"],
+    "mathematics": ["mathematics", "mathematical", "theorem", "proof", "equation"]
+}
+_DOMAIN_PATTERNS = tuple(
+    (domain, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE | re.ASCII))
+    for domain, keywords in _DOMAIN_KEYWORDS.items()
+)
+
+# URL fragments indicating a content type, matched case-insensitively
+_BOOK_URL_PATTERN = re.compile(r'gutenberg|book|ebook|pdf', re.IGNORECASE)
+_PAPER_URL_PATTERN = re.compile(r'arxiv|paper|journal|doi', re.IGNORECASE)
+_REFERENCE_URL_PATTERN = re.compile(r'wikipedia|encyclopedia|reference', re.IGNORECASE)
+
+# HTML <title> element, and any markup inside it
+_TITLE_PATTERN = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+def _sql_literal(value: str) -> str:
+    """Render a string as a SQL literal, for DDL where bind parameters are not allowed"""
+    return "'" + value.replace("'", "''") + "'"
+
+# orjson serializes datetimes natively; these add numpy values and non-string keys
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def _json_result(payload: Any) -> CallToolResult:
+    """Build a tool result carrying payload as JSON text and, for objects, as structured content"""
+    data = orjson.dumps(payload, option=_JSON_OPTIONS)
+    # Structured content is decoded from the same bytes so it holds only JSON-safe values
+    return CallToolResult(
+        content=[TextContent(type="text", text=data.decode())],
+        structuredContent=orjson.loads(data) if isinstance(payload, dict) else None
+    )
+
 class StorageStrategy(Enum):
     """Storage strategy options"""
     POSTGRES_ONLY = "postgres_only"
@@ -58,7 +109,7 @@ class ContentType(Enum):
     ACADEMIC_PAPER = "academic_paper"  # Usually 1-5MB
     REFERENCE = "reference"            # Encyclopedias, etc.
 
-@dataclass
+@dataclass(slots=True)
 class DataSourceAnalysis:
     """Analysis result for a data source"""
     url: str
@@ -74,13 +125,53 @@ class DataSourceAnalysis:
 class IntelligentStorageManager:
     """Manages intelligent storage decisions and database operations"""
     
+    # Bytes of each source downloaded for analysis
+    ANALYSIS_SAMPLE_BYTES = 5000
+    
+    # Content types whose storage strategy does not depend on the content
+    CONTENT_TYPE_STRATEGIES = {
+        ContentType.SMALL_TEXT: StorageStrategy.POSTGRES_ONLY,
+        ContentType.BOOK: StorageStrategy.QDRANT_ONLY,
+        ContentType.LARGE_TEXT: StorageStrategy.HYBRID,
+        ContentType.ACADEMIC_PAPER: StorageStrategy.HYBRID,
+    }
+    
+    # Domains stored hybrid even when their content is not complex
+    HYBRID_DOMAINS = frozenset({"philosophy", "science"})
+    
+    # Analyses are reused for this many seconds, for up to this many URLs
+    ANALYSIS_CACHE_TTL = 3600
+    ANALYSIS_CACHE_SIZE = 10_000
+    
     def __init__(self, postgres_url: str, qdrant_url: str):
         self.postgres_url = postgres_url
         self.qdrant_url = qdrant_url
-        self.engine = create_engine(postgres_url)
-        self.Session = sessionmaker(bind=self.engine)
+        # Async engine so table checks and DDL never block the event loop
+        self.engine = create_async_engine(
+            postgres_url.replace("postgresql://", "postgresql+asyncpg://"),
+            pool_size=2,
+            max_overflow=14,
+            pool_pre_ping=True
+        )
         self.metadata = MetaData()
         
+        # Shared HTTP client so analysis and scraping reuse pooled connections
+        self.http_client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128)
+        )
+        
+        # Compact language identifier; only the first 1KB is examined, past
+        # which accuracy stops improving
+        self._language_identifier = (
+            gcld3.NNetLanguageIdentifier(min_num_bytes=0, max_num_bytes=1000) if gcld3 else None
+        )
+        
+        # Recent analyses by URL digest, least recently used first
+        self._analysis_cache: OrderedDict[bytes, Tuple[float, DataSourceAnalysis]] = OrderedDict()
+        
         # Size thresholds for storage decisions
         self.size_thresholds = {
             ContentType.SMALL_TEXT: 10_000,      # 10KB
@@ -89,20 +180,42 @@ class IntelligentStorageManager:
             ContentType.BOOK: float('inf')       # No upper limit
         }
         
-    async def analyze_data_source(self, url: str) -> DataSourceAnalysis:
-        """Analyze a data source to determine optimal storage strategy"""
+    async def analyze_data_source(self, url: str, force: bool = False) -> DataSourceAnalysis:
+        """Analyze a data source to determine optimal storage strategy
+        
+        Results are cached per URL for ANALYSIS_CACHE_TTL seconds; pass
+        force=True to re-fetch and re-analyze regardless.
+        """
+        
+        cache_key = hashlib.blake2b(url.encode(), digest_size=16).digest()
+        if not force:
+            cached = self._analysis_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.ANALYSIS_CACHE_TTL:
+                self._analysis_cache.move_to_end(cache_key)
+                return cached[1]
         
         try:
-            # Fetch headers to get content info
-            async with httpx.AsyncClient() as client:
-                response = await client.head(url, follow_redirects=True)
-                content_length = response.headers.get('content-length')
+            # Fetch the first 5KB for analysis in one request; the total size
+            # comes from Content-Range, or Content-Length if Range is ignored
+            sample_range = f"bytes=0-{self.ANALYSIS_SAMPLE_BYTES - 1}"
+            async with self.http_client.stream("GET", url, headers={"Range": sample_range}) as response:
                 content_type = response.headers.get('content-type', '')
+                if response.status_code == 206:
+                    total_size = response.headers.get('content-range', '').rpartition('/')[2]
+                    content_length = total_size if total_size.isdigit() else None
+                else:
+                    content_length = response.headers.get('content-length')
                 
-                # Get a sample of the content for analysis
-                response = await client.get(url, follow_redirects=True)
-                content = response.text[:5000]  # First 5KB for analysis
-                
+                # Stop reading at the sample size even if the server sends the whole body
+                sample = bytearray()
+                async for chunk in response.aiter_bytes():
+                    sample += chunk
+                    if len(sample) >= self.ANALYSIS_SAMPLE_BYTES:
+                        break
+                content = sample[:self.ANALYSIS_SAMPLE_BYTES].decode(
+                    response.charset_encoding or 'utf-8', errors='replace'
+                )
+            
             # Analyze content
             analysis = await self._analyze_content(url, content, content_length, content_type)
             
@@ -111,9 +224,17 @@ class IntelligentStorageManager:
             
             # Generate table name if needed
             if analysis.storage_strategy in [StorageStrategy.POSTGRES_ONLY, StorageStrategy.HYBRID]:
-                analysis.table_name = self._generate_table_name(analysis)
+                analysis.table_name = self._generate_table_name(
+                    analysis.domain, analysis.content_type.value, analysis.url
+                )
             
             logger.info(f"Analysis complete for {url}: {analysis.content_type.value}, {analysis.storage_strategy.value}")
+            
+            self._analysis_cache[cache_key] = (time.monotonic(), analysis)
+            self._analysis_cache.move_to_end(cache_key)
+            if len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+            
             return analysis
             
         except Exception as e:
@@ -129,6 +250,11 @@ class IntelligentStorageManager:
                 storage_strategy=StorageStrategy.HYBRID
             )
     
+    async def aclose(self):
+        """Close the shared HTTP client and the database connection pool"""
+        await self.http_client.aclose()
+        await self.engine.dispose()
+    
     async def _analyze_content(self, url: str, content: str, content_length: str, content_type: str) -> DataSourceAnalysis:
         """Analyze content characteristics"""
         
@@ -144,11 +270,14 @@ class IntelligentStorageManager:
         # Determine domain
         domain = self._classify_domain(url, content)
         
+        # Split once; complexity and metadata both work from the word list
+        words = content.split()
+        
         # Calculate complexity score
-        complexity_score = self._calculate_complexity(content)
+        complexity_score = self._calculate_complexity(content, words)
         
         # Extract metadata
-        metadata = self._extract_metadata(url, content, content_type)
+        metadata = self._extract_metadata(url, content, content_type, len(words))
         
         return DataSourceAnalysis(
             url=url,
@@ -165,15 +294,15 @@ class IntelligentStorageManager:
         """Classify content type based on size and characteristics"""
         
         # Book indicators
-        if any(indicator in url.lower() for indicator in ['gutenberg', 'book', 'ebook', 'pdf']):
+        if _BOOK_URL_PATTERN.search(url):
             return ContentType.BOOK
         
         # Academic paper indicators
-        if any(indicator in url.lower() for indicator in ['arxiv', 'paper', 'journal', 'doi']):
+        if _PAPER_URL_PATTERN.search(url):
             return ContentType.ACADEMIC_PAPER
         
         # Reference indicators
-        if any(indicator in url.lower() for indicator in ['wikipedia', 'encyclopedia', 'reference']):
+        if _REFERENCE_URL_PATTERN.search(url):
             return ContentType.REFERENCE
         
         # Size-based classification
@@ -187,73 +316,57 @@ class IntelligentStorageManager:
             return ContentType.BOOK
     
     def _detect_language(self, content: str) -> str:
-        """Detect content language (simplified)"""
-        # This is a simplified implementation
-        # In production, use langdetect or similar
-        return "en"
+        """Detect content language, defaulting to English when unsure"""
+        if self._language_identifier is None or not content:
+            return "en"
+        
+        result = self._language_identifier.FindLanguage(text=content)
+        return result.language if result.is_reliable else "en"
     
     def _classify_domain(self, url: str, content: str) -> str:
         """Classify content domain"""
         
-        domain_keywords = {
-            "religion": ["bible", "quran", "torah", "buddhist", "spiritual", "religious"],
-            "philosophy": ["philosophy", "philosophical", "ethics", "metaphysics", "logic"],
-            "science": ["science", "scientific", "research", "study", "analysis"],
-            "literature": ["literature", "novel", "poetry", "fiction", "literary"],
-            "history": ["history", "historical", "ancient", "medieval", "modern"],
-            "technology": ["technology", "technical", "computer", "software", "programming"],
-            "medicine": ["medical", "medicine", "health", "clinical", "patient"],
-            "mathematics": ["mathematics", "mathematical", "theorem", "proof", "equation"]
-        }
-        
-        url_lower = url.lower()
-        content_lower = content.lower()
-        
-        for domain, keywords in domain_keywords.items():
-            if any(keyword in url_lower or keyword in content_lower for keyword in keywords):
+        # Domains are checked in priority order; each pattern matches any of its keywords
+        for domain, pattern in _DOMAIN_PATTERNS:
+            if pattern.search(url) or pattern.search(content):
                 return domain
         
         return "general"
     
-    def _calculate_complexity(self, content: str) -> float:
-        """Calculate content complexity score (0-1)"""
+    def _calculate_complexity(self, content: str, words: List[str]) -> float:
+        """Calculate content complexity score (0-1) from the content and its words"""
         
         # Simple complexity metrics
-        words = content.split()
         if not words:
             return 0.0
         
         # Average word length
-        avg_word_length = sum(len(word) for word in words) / len(words)
+        avg_word_length = sum(map(len, words)) / len(words)
         
-        # Sentence complexity (simplified)
-        sentences = content.split('.')
-        avg_sentence_length = len(words) / len(sentences) if sentences else 0
+        # Sentence complexity (simplified); n periods delimit n + 1 sentences
+        sentence_count = content.count('.') + 1
+        avg_sentence_length = len(words) / sentence_count
         
         # Normalize to 0-1 scale
         complexity = min(1.0, (avg_word_length * 0.1) + (avg_sentence_length * 0.01))
         
         return complexity
     
-    def _extract_metadata(self, url: str, content: str, content_type: str) -> Dict[str, Any]:
+    def _extract_metadata(self, url: str, content: str, content_type: str, word_count: int) -> Dict[str, Any]:
         """Extract metadata from content"""
         
         metadata = {
             "source_url": url,
             "content_type": content_type,
             "scraped_at": datetime.utcnow().isoformat(),
-            "word_count": len(content.split()),
+            "word_count": word_count,
             "character_count": len(content)
         }
         
-        # Try to extract title from HTML
-        try:
-            soup = BeautifulSoup(content, 'html.parser')
-            title = soup.find('title')
-            if title:
-                metadata["title"] = title.get_text().strip()
-        except:
-            pass
+        # Extract title from HTML
+        title = _TITLE_PATTERN.search(content)
+        if title:
+            metadata["title"] = html.unescape(_TAG_PATTERN.sub('', title.group(1))).strip()
         
         return metadata
     
@@ -261,31 +374,26 @@ class IntelligentStorageManager:
         """Determine optimal storage strategy based on analysis"""
         
         # Strategy decision logic
-        if analysis.content_type == ContentType.SMALL_TEXT:
-            return StorageStrategy.POSTGRES_ONLY
-        
-        elif analysis.content_type == ContentType.BOOK:
-            return StorageStrategy.QDRANT_ONLY
+        strategy = self.CONTENT_TYPE_STRATEGIES.get(analysis.content_type)
+        if strategy:
+            return strategy
         
-        elif analysis.content_type in [ContentType.LARGE_TEXT, ContentType.ACADEMIC_PAPER]:
+        # Medium text and references - decide based on complexity and domain
+        if analysis.complexity_score > 0.7 or analysis.domain in self.HYBRID_DOMAINS:
             return StorageStrategy.HYBRID
-        
         else:
-            # Medium text - decide based on complexity and domain
-            if analysis.complexity_score > 0.7 or analysis.domain in ["philosophy", "science"]:
-                return StorageStrategy.HYBRID
-            else:
-                return StorageStrategy.POSTGRES_ONLY
+            return StorageStrategy.POSTGRES_ONLY
     
-    def _generate_table_name(self, analysis: DataSourceAnalysis) -> str:
-        """Generate appropriate table name for the content"""
+    @staticmethod
+    @lru_cache(maxsize=16384)
+    def _generate_table_name(domain: str, content_type: str, url: str) -> str:
+        """Generate appropriate table name for the content (cached per input)"""
         
         # Generate table name based on domain and content type
-        domain = analysis.domain.replace(" ", "_").lower()
-        content_type = analysis.content_type.value
+        domain = domain.replace(" ", "_").lower()
         
         # Add hash for uniqueness if needed
-        url_hash = hashlib.md5(analysis.url.encode()).hexdigest()[:8]
+        url_hash = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
         
         return f"yggdrasil_{domain}_{content_type}_{url_hash}"
     
@@ -296,26 +404,22 @@ class IntelligentStorageManager:
             return False
         
         try:
-            with self.engine.connect() as conn:
-                # Check if table exists
-                result = conn.execute(text(f"""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_name = '{analysis.table_name}'
-                    );
-                """))
-                
-                if result.scalar():
-                    logger.info(f"Table {analysis.table_name} already exists")
-                    return True
-                
-                # Create optimized table based on content type
-                create_sql = self._generate_table_sql(analysis)
-                conn.execute(text(create_sql))
-                conn.commit()
-                
-                logger.info(f"Created dynamic table: {analysis.table_name}")
-                return True
+            # Create optimized table based on content type; the script is
+            # idempotent, so no separate existence check is needed
+            create_sql = self._generate_table_sql(analysis)
+            
+            async with self.engine.connect() as conn:
+                # asyncpg prepares every statement SQLAlchemy sends, which rules out
+                # multi-statement scripts, so the DDL goes through the driver's
+                # simple-query path in a single round trip. That bypasses
+                # SQLAlchemy's transaction, so the driver's own one makes the
+                # table and its indexes appear together or not at all
+                raw_conn = (await conn.get_raw_connection()).driver_connection
+                async with raw_conn.transaction():
+                    await raw_conn.execute(create_sql)
+            
+            logger.info(f"Ensured dynamic table: {analysis.table_name}")
+            return True
                 
         except Exception as e:
             logger.error(f"Error creating dynamic table: {e}")
@@ -324,15 +428,20 @@ class IntelligentStorageManager:
     def _generate_table_sql(self, analysis: DataSourceAnalysis) -> str:
         """Generate optimized table SQL based on content analysis"""
         
+        # Quote identifiers and literals so no analysis value is spliced into SQL raw
+        quote = self.engine.dialect.identifier_preparer.quote
+        table = quote(analysis.table_name)
+        index_prefix = f"idx_{analysis.table_name}"
+        
         base_sql = f"""
-        CREATE TABLE {analysis.table_name} (
+        CREATE TABLE IF NOT EXISTS {table} (
             id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
             title TEXT NOT NULL,
             content TEXT,
             author TEXT,
             source_url TEXT NOT NULL,
-            domain VARCHAR(50) DEFAULT '{analysis.domain}',
-            language VARCHAR(10) DEFAULT '{analysis.language}',
+            domain VARCHAR(50) DEFAULT {_sql_literal(analysis.domain)},
+            language VARCHAR(10) DEFAULT {_sql_literal(analysis.language)},
             word_count INTEGER,
             character_count INTEGER,
             complexity_score FLOAT,
@@ -345,14 +454,14 @@ class IntelligentStorageManager:
         # Add indexes based on content type
         if analysis.content_type in [ContentType.LARGE_TEXT, ContentType.BOOK]:
             base_sql += f"""
-            CREATE INDEX idx_{analysis.table_name}_title ON {analysis.table_name} USING gin(to_tsvector('english', title));
-            CREATE INDEX idx_{analysis.table_name}_content ON {analysis.table_name} USING gin(to_tsvector('english', content));
-            CREATE INDEX idx_{analysis.table_name}_domain ON {analysis.table_name}(domain);
+            CREATE INDEX IF NOT EXISTS {quote(index_prefix + "_title")} ON {table} USING gin(to_tsvector('english', title));
+            CREATE INDEX IF NOT EXISTS {quote(index_prefix + "_content")} ON {table} USING gin(to_tsvector('english', content));
+            CREATE INDEX IF NOT EXISTS {quote(index_prefix + "_domain")} ON {table}(domain);
             """
         else:
             base_sql += f"""
-            CREATE INDEX idx_{analysis.table_name}_title ON {analysis.table_name}(title);
-            CREATE INDEX idx_{analysis.table_name}_domain ON {analysis.table_name}(domain);
+            CREATE INDEX IF NOT EXISTS {quote(index_prefix + "_title")} ON {table}(title);
+            CREATE INDEX IF NOT EXISTS {quote(index_prefix + "_domain")} ON {table}(domain);
             """
         
         return base_sql
@@ -360,6 +469,9 @@ class IntelligentStorageManager:
 class YggdrasilMCPServer:
     """Main MCP Server for Yggdrasil system with AI agent integration"""
     
+    # Upper bound on sources fetched at once by analyze_data_sources
+    MAX_CONCURRENT_ANALYSES = 32
+    
     def __init__(self):
         self.server = Server("yggdrasil-mcp-server")
         self.storage_manager = IntelligentStorageManager(
@@ -397,6 +509,21 @@ class YggdrasilMCPServer:
                             "required": ["url"]
                         }
                     ),
+                    Tool(
+                        name="analyze_data_sources",
+                        description="Analyze several data sources concurrently to determine their storage strategies",
+                        inputSchema={
+                            "type": "object",
+                            "properties": {
+                                "urls": {
+                                    "type": "array",
+                                    "items": {"type": "string"},
+                                    "description": "URLs of the data sources to analyze"
+                                }
+                            },
+                            "required": ["urls"]
+                        }
+                    ),
                     Tool(
                         name="intelligent_scrape_and_store",
                         description="Intelligently scrape and store data with optimal strategy",
@@ -514,6 +641,9 @@ class YggdrasilMCPServer:
             if name == "analyze_data_source":
                 return await self._analyze_data_source(arguments["url"])
             
+            elif name == "analyze_data_sources":
+                return await self._analyze_data_sources(arguments["urls"])
+            
             elif name == "intelligent_scrape_and_store":
                 return await self._intelligent_scrape_and_store(
                     arguments["url"],
@@ -572,12 +702,7 @@ class YggdrasilMCPServer:
             if result.error_message:
                 response["error"] = result.error_message
             
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"AI Content Analysis Results:\n{json.dumps(response, indent=2)}"
-                )]
-            )
+            return _json_result(response)
             
         except Exception as e:
             return CallToolResult(
@@ -593,12 +718,7 @@ class YggdrasilMCPServer:
         try:
             analysis_types = self.agent_manager.get_available_analyses()
             
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Available AI Analysis Types:\n{json.dumps(analysis_types, indent=2)}"
-                )]
-            )
+            return _json_result(analysis_types)
             
         except Exception as e:
             return CallToolResult(
@@ -614,12 +734,7 @@ class YggdrasilMCPServer:
         try:
             stats = self.agent_manager.get_performance_stats()
             
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Agent Performance Report:\n{json.dumps(stats, indent=2)}"
-                )]
-            )
+            return _json_result(stats)
             
         except Exception as e:
             return CallToolResult(
@@ -634,25 +749,7 @@ class YggdrasilMCPServer:
         
         try:
             analysis = await self.storage_manager.analyze_data_source(url)
-            
-            result = {
-                "url": analysis.url,
-                "content_type": analysis.content_type.value,
-                "estimated_size": analysis.estimated_size,
-                "language": analysis.language,
-                "domain": analysis.domain,
-                "complexity_score": analysis.complexity_score,
-                "storage_strategy": analysis.storage_strategy.value,
-                "table_name": analysis.table_name,
-                "metadata": analysis.metadata
-            }
-            
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Data Source Analysis:\n{json.dumps(result, indent=2)}"
-                )]
-            )
+            return _json_result(self._analysis_to_dict(analysis))
             
         except Exception as e:
             return CallToolResult(
@@ -662,12 +759,44 @@ class YggdrasilMCPServer:
                 )]
             )
     
+    async def _analyze_data_sources(self, urls: List[str]) -> CallToolResult:
+        """Analyze several data sources concurrently and return their strategies"""
+        
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ANALYSES)
+        
+        async def analyze(url: str) -> DataSourceAnalysis:
+            async with semaphore:
+                return await self.storage_manager.analyze_data_source(url)
+        
+        analyses = await asyncio.gather(*map(analyze, urls), return_exceptions=True)
+        
+        result = [
+            {"url": url, "error": str(analysis)} if isinstance(analysis, Exception)
+            else self._analysis_to_dict(analysis)
+            for url, analysis in zip(urls, analyses)
+        ]
+        return _json_result(result)
+    
+    def _analysis_to_dict(self, analysis: DataSourceAnalysis) -> Dict[str, Any]:
+        """JSON-ready form of a data source analysis"""
+        return {
+            "url": analysis.url,
+            "content_type": analysis.content_type.value,
+            "estimated_size": analysis.estimated_size,
+            "language": analysis.language,
+            "domain": analysis.domain,
+            "complexity_score": analysis.complexity_score,
+            "storage_strategy": analysis.storage_strategy.value,
+            "table_name": analysis.table_name,
+            "metadata": analysis.metadata
+        }
+    
     async def _intelligent_scrape_and_store(self, url: str, force_analysis: bool) -> CallToolResult:
         """Intelligently scrape and store data"""
         
         try:
             # Analyze the data source
-            analysis = await self.storage_manager.analyze_data_source(url)
+            analysis = await self.storage_manager.analyze_data_source(url, force=force_analysis)
             
             # Create dynamic table if needed
             if analysis.storage_strategy in [StorageStrategy.POSTGRES_ONLY, StorageStrategy.HYBRID]:
@@ -676,12 +805,7 @@ class YggdrasilMCPServer:
             # Perform the actual scraping
             result = await self._perform_scraping(url, analysis)
             
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Scraping completed successfully:\n{json.dumps(result, indent=2)}"
-                )]
-            )
+            return _json_result(result)
             
         except Exception as e:
             return CallToolResult(
@@ -697,9 +821,7 @@ class YggdrasilMCPServer:
         # This is a simplified implementation
         # In production, this would use the existing scraping infrastructure
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            content = response.text
+        content = await self._download_text(url)
         
         # Store based on strategy
         if analysis.storage_strategy == StorageStrategy.POSTGRES_ONLY:
@@ -711,6 +833,13 @@ class YggdrasilMCPServer:
         
         return {"status": "stored", "strategy": analysis.storage_strategy.value}
     
+    async def _download_text(self, url: str) -> str:
+        """Download a source as text, raising for error responses"""
+        
+        response = await self.storage_manager.http_client.get(url)
+        response.raise_for_status()
+        return response.text
+    
     async def _store_in_postgres(self, content: str, analysis: DataSourceAnalysis) -> Dict[str, Any]:
         """Store data in PostgreSQL"""
         # Implementation would use SQLAlchemy to store in the dynamic table
@@ -748,12 +877,7 @@ class YggdrasilMCPServer:
                 ]
             }
             
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Storage optimization complete:\n{json.dumps(result, indent=2)}"
-                )]
-            )
+            return _json_result(result)
             
         except Exception as e:
             return CallToolResult(
@@ -783,12 +907,7 @@ class YggdrasilMCPServer:
                 ]
             }
             
-            return CallToolResult(
-                content=[TextContent(
-                    type="text",
-                    text=f"Performance Report:\n{json.dumps(result, indent=2)}"
-                )]
-            )
+            return _json_result(result)
             
         except Exception as e:
             return CallToolResult(
@@ -798,20 +917,72 @@ class YggdrasilMCPServer:
                 )]
             )
 
-async def main():
-    """Run the MCP server"""
-    mcp_server = YggdrasilMCPServer()
-    
+def _initialization_options(mcp_server: YggdrasilMCPServer) -> InitializationOptions:
+    """Server identity and capabilities sent to connecting clients"""
+    return InitializationOptions(
+        server_name="yggdrasil-mcp-server",
+        server_version="1.0.0",
+        capabilities=mcp_server.server.get_capabilities()
+    )
+
+async def run_stdio(mcp_server: YggdrasilMCPServer):
+    """Serve a single client over stdin/stdout"""
     async with stdio_server() as (read_stream, write_stream):
         await mcp_server.server.run(
             read_stream,
             write_stream,
-            InitializationOptions(
-                server_name="yggdrasil-mcp-server",
-                server_version="1.0.0",
-                capabilities=mcp_server.server.get_capabilities()
-            )
+            _initialization_options(mcp_server)
         )
 
+async def run_sse(mcp_server: YggdrasilMCPServer, host: str, port: int):
+    """Serve any number of clients over HTTP/SSE as a long-running process
+    
+    Clients connect with YggdrasilMCPClient(server_url="http://<host>:<port>/sse"),
+    so models and database connections are loaded once rather than per client.
+    """
+    from mcp.server.sse import SseServerTransport
+    from starlette.applications import Starlette
+    from starlette.responses import Response
+    from starlette.routing import Mount, Route
+    import uvicorn
+    
+    sse = SseServerTransport("/messages/")
+    
+    async def handle_sse(request):
+        async with sse.connect_sse(request.scope, request.receive, request._send) as (read_stream, write_stream):
+            await mcp_server.server.run(
+                read_stream,
+                write_stream,
+                _initialization_options(mcp_server)
+            )
+        return Response()
+    
+    app = Starlette(routes=[
+        Route("/sse", endpoint=handle_sse),
+        Mount("/messages/", app=sse.handle_post_message),
+    ])
+    await uvicorn.Server(uvicorn.Config(app, host=host, port=port)).serve()
+
+async def main():
+    """Run the MCP server"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Yggdrasil MCP Server")
+    parser.add_argument("--transport", choices=["stdio", "sse"], default="stdio",
+                       help="Serve one client over stdio, or many over HTTP/SSE")
+    parser.add_argument("--host", default="127.0.0.1", help="Host to bind (for sse)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to bind (for sse)")
+    args = parser.parse_args()
+    
+    mcp_server = YggdrasilMCPServer()
+    
+    try:
+        if args.transport == "sse":
+            await run_sse(mcp_server, args.host, args.port)
+        else:
+            await run_stdio(mcp_server)
+    finally:
+        await mcp_server.storage_manager.aclose()
+
 if __name__ == "__main__":
     asyncio.run(main())